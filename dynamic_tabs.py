@@ -18,6 +18,21 @@ from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont, QIcon
 from styles import AppTheme
 
+
+# The tab context menu is rebuilt per right-click; its sheet is formatted once.
+_TAB_MENU_QSS = f"""
+    QMenu {{
+        background-color: {AppTheme.BACKGROUND};
+        color: {AppTheme.TEXT};
+        border: 2px solid {AppTheme.BORDER};
+    }}
+    QMenu::item:selected {{
+        background-color: {AppTheme.PRIMARY};
+        color: #FFFFFF;
+    }}
+"""
+
+
 class DynamicTabWidget(QTabWidget):
     """Tab widget where each tab represents a filter view."""
     
@@ -177,17 +192,7 @@ class DynamicTabWidget(QTabWidget):
     def _show_menu_for_tab(self, index, global_pos):
         """Show context menu for specific tab."""
         menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {AppTheme.BACKGROUND};
-                color: {AppTheme.TEXT};
-                border: 2px solid {AppTheme.BORDER};
-            }}
-            QMenu::item:selected {{
-                background-color: {AppTheme.PRIMARY};
-                color: #FFFFFF;
-            }}
-        """)
+        menu.setStyleSheet(_TAB_MENU_QSS)
         
         widget = self.widget(index)
         tab_kind = getattr(widget, "tab_kind", None)
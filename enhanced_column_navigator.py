@@ -16,6 +16,25 @@ from typing import List, Dict, Set, Optional
 from styles import AppTheme
 
 
+# Shared by every navigation arrow; formatted once at import.
+_NAV_BUTTON_QSS = f"""
+    QToolButton {{
+        background-color: {AppTheme.SURFACE};
+        color: {AppTheme.TEXT};
+        border: 1px solid {AppTheme.BORDER};
+        border-radius: 4px;
+        font-weight: 700;
+    }}
+    QToolButton:hover {{
+        background-color: {AppTheme.PRIMARY};
+        color: #FFFFFF;
+        border-color: {AppTheme.PRIMARY};
+    }}
+    QToolButton:pressed {{
+        background-color: {AppTheme.PRIMARY_DARK};
+    }}
+"""
+
 class ColumnMinimap(QWidget):
     """Compact minimap slider showing all columns with smart interaction."""
 
@@ -179,18 +198,32 @@ class ColumnMinimap(QWidget):
 class QuickFilterButton(QToolButton):
     """Quick filter button for column types."""
 
+    # Formatted sheets keyed by (base colour rgba, checked); shared by all buttons.
+    _QSS_CACHE: Dict[tuple, str] = {}
+
     def __init__(self, text: str, color: QColor, parent=None):
         super().__init__(parent)
         self.setText(text)
         self.setCheckable(True)
         self.base_color = color
+        self._styled_checked = None
         self._update_style()
 
     def _update_style(self):
         checked = self.isChecked()
+        if checked == self._styled_checked:
+            return
+        self._styled_checked = checked
+        key = (self.base_color.rgba(), checked)
+        qss = self._QSS_CACHE.get(key)
+        if qss is None:
+            qss = self._QSS_CACHE[key] = self._build_style(checked)
+        self.setStyleSheet(qss)
+
+    def _build_style(self, checked: bool) -> str:
         hover_bg = self.base_color.lighter(110).name() if checked else AppTheme.GRAY_100
         hover_text = "#FFFFFF" if checked else AppTheme.TEXT
-        self.setStyleSheet(f"""
+        return f"""
             QToolButton {{
                 background-color: {self.base_color.name() if checked else AppTheme.SURFACE};
                 color: {"#FFFFFF" if checked else AppTheme.TEXT};
@@ -204,7 +237,7 @@ class QuickFilterButton(QToolButton):
                 background-color: {hover_bg};
                 color: {hover_text};
             }}
-        """)
+        """
 
     def setChecked(self, checked):
         super().setChecked(checked)
@@ -388,23 +421,7 @@ class EnhancedColumnNavigator(QWidget):
     def _style_nav_button(self, btn: QToolButton):
         """Style navigation button."""
         btn.setFixedSize(24, 24)
-        btn.setStyleSheet(f"""
-            QToolButton {{
-                background-color: {AppTheme.SURFACE};
-                color: {AppTheme.TEXT};
-                border: 1px solid {AppTheme.BORDER};
-                border-radius: 4px;
-                font-weight: 700;
-            }}
-            QToolButton:hover {{
-                background-color: {AppTheme.PRIMARY};
-                color: #FFFFFF;
-                border-color: {AppTheme.PRIMARY};
-            }}
-            QToolButton:pressed {{
-                background-color: {AppTheme.PRIMARY_DARK};
-            }}
-        """)
+        btn.setStyleSheet(_NAV_BUTTON_QSS)
 
     def set_columns(self, columns: List[str], column_types: Dict[str, str] = None,
                     filtered_columns: Set[str] = None):
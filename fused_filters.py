@@ -0,0 +1,90 @@
+"""
+Fused numeric comparison kernel for column filters.
+Uses Numba when it is installed, then numexpr, and NumPy ufuncs otherwise.
+Both accelerators are optional extras (see requirements.txt); every tier
+returns the same mask.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import numexpr
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
+
+# Operator codes passed to the kernel; keys match NumericFilter.OPERATORS.
+OP_CODES = {">=": 0, "<=": 1, "==": 2, ">": 3, "<": 4, "!=": 5}
+
+_UFUNCS = (np.greater_equal, np.less_equal, np.equal, np.greater, np.less, np.not_equal)
+_OP_SYMBOLS = (">=", "<=", "==", ">", "<", "!=")
+
+# numexpr's thread start-up only pays off for several comparisons or long columns.
+NUMEXPR_MIN_ROWS = 200_000
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _numeric_and_kernel(values, ops, thresholds, out):
+        for i in prange(values.shape[0]):
+            v = values[i]
+            # Plain IEEE comparisons, as in NumericFilter.matches: NaN fails
+            # every operator except "!=".
+            keep = True
+            k = 0
+            while keep and k < ops.shape[0]:
+                o = ops[k]
+                t = thresholds[k]
+                if o == 0:
+                    keep = v >= t
+                elif o == 1:
+                    keep = v <= t
+                elif o == 2:
+                    keep = v == t
+                elif o == 3:
+                    keep = v > t
+                elif o == 4:
+                    keep = v < t
+                else:
+                    keep = v != t
+                k += 1
+            out[i] = keep
+
+
+def numeric_and(values: np.ndarray, ops: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """AND every (operator code, threshold) comparison over a float64 column.
+
+    NaN follows NumericFilter.matches: it fails every operator except "!=".
+    With Numba or numexpr the comparisons are fused into a single threaded
+    pass with no intermediate arrays.
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if HAS_NUMBA:
+        out = np.empty(values.shape[0], dtype=np.bool_)
+        _numeric_and_kernel(
+            values,
+            np.ascontiguousarray(ops, dtype=np.int8),
+            np.ascontiguousarray(thresholds, dtype=np.float64),
+            out,
+        )
+        return out
+
+    if HAS_NUMEXPR and (len(ops) >= 2 or values.shape[0] >= NUMEXPR_MIN_ROWS):
+        local_dict = {"v": values}
+        terms = []
+        for k, (op, threshold) in enumerate(zip(ops, thresholds)):
+            local_dict[f"t{k}"] = float(threshold)
+            terms.append(f"(v {_OP_SYMBOLS[op]} t{k})")
+        return numexpr.evaluate(" & ".join(terms), local_dict=local_dict)
+
+    mask = np.ones(values.shape[0], dtype=bool)
+    for op, threshold in zip(ops, thresholds):
+        np.logical_and(mask, _UFUNCS[op](values, threshold), out=mask)
+    return mask
@@ -67,7 +67,35 @@ class TabWithFilters(QWidget):
     
     filterAdded = pyqtSignal(object)  # filter_rule
     filterRemoved = pyqtSignal(object)  # filter_rule
-    
+
+    # Chip sheets are rebuilt for every chip on each display refresh, so
+    # format them once for the class.
+    _CHIP_QSS = """
+        QFrame {
+            background-color: #DBEAFE;
+            border: 2px solid #2563EB;
+            border-radius: 6px;
+            padding: 6px 10px;
+        }
+        QFrame:hover {
+            background-color: #F3F4F6;
+        }
+    """
+    _CHIP_LABEL_QSS = f"background: transparent; border: none; color: {AppTheme.TEXT}; font-weight: 600;"
+    _CHIP_REMOVE_QSS = """
+        QPushButton {
+            background-color: #EF4444;
+            color: #FFFFFF;
+            border: none;
+            font-size: 14px;
+            font-weight: bold;
+            border-radius: 10px;
+        }
+        QPushButton:hover {
+            background-color: #DC2626;
+        }
+    """
+
     def __init__(self, tab_name: str, table_view, parent=None):
         super().__init__(parent)
         self.tab_name = tab_name
@@ -220,17 +248,7 @@ class TabWithFilters(QWidget):
     def _create_filter_chip(self, filter_rule):
         """Create a visual chip for a filter."""
         chip = QFrame()
-        chip.setStyleSheet("""
-            QFrame {
-                background-color: #DBEAFE;
-                border: 2px solid #2563EB;
-                border-radius: 6px;
-                padding: 6px 10px;
-            }
-            QFrame:hover {
-                background-color: #F3F4F6;
-            }
-        """)
+        chip.setStyleSheet(self._CHIP_QSS)
         
         chip_layout = QHBoxLayout(chip)
         chip_layout.setContentsMargins(6, 4, 6, 4)
@@ -238,25 +256,13 @@ class TabWithFilters(QWidget):
         
         # Filter text
         label = QLabel(str(filter_rule))
-        label.setStyleSheet(f"background: transparent; border: none; color: {AppTheme.TEXT}; font-weight: 600;")
+        label.setStyleSheet(self._CHIP_LABEL_QSS)
         chip_layout.addWidget(label)
         
         # Remove button
         remove_btn = QPushButton("X")
         remove_btn.setFixedSize(20, 20)
-        remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #EF4444;
-                color: #FFFFFF;
-                border: none;
-                font-size: 14px;
-                font-weight: bold;
-                border-radius: 10px;
-            }
-            QPushButton:hover {
-                background-color: #DC2626;
-            }
-        """)
+        remove_btn.setStyleSheet(self._CHIP_REMOVE_QSS)
         remove_btn.clicked.connect(lambda: self.remove_filter(filter_rule))
         chip_layout.addWidget(remove_btn)
         
@@ -9,9 +9,10 @@ Implements complete design document with:
 - All Features Working
 """
 
+import copy
 import os
 import sys
-import json
+import threading
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFrame, QSplitter,
     QLineEdit, QComboBox, QLabel, QAction, QMenu, QToolButton,
@@ -23,7 +24,7 @@ from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon, QKeySequence
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set
 
 from models import DataFrameModel, FilterManager, NumericFilter, TextFilter, DateFilter, FilterRule
 from proxies import SmartSearchProxy                     
@@ -37,7 +38,7 @@ from utils import (
     load_dataframe_from_file, add_date_column, merge_dataframes,
     export_to_excel_formatted, create_archive_snapshot, get_archive_list,
     DATE_COL_NAME, save_filters_to_file, load_filters_from_file,
-    get_last_loaded_file, save_last_loaded_file
+    get_last_loaded_file, save_last_loaded_file, read_json_file, write_json_file_atomic
 )
 from styles import AppTheme
 from modern_ui import ModernActionBar, CompactHeader, ModernSearchBar
@@ -246,6 +247,17 @@ class MergeDialog(QDialog):
 
 SUPPORTED_EXTENSIONS = ('.xlsx', '.xls', '.csv', '.tsv', '.json')
 
+# Shared result for empty frames; read-only so no caller can mutate it.
+_EMPTY_BOOL_MASK = np.empty(0, dtype=bool)
+_EMPTY_BOOL_MASK.setflags(write=False)
+
+
+def _write_final_snapshot(df: pd.DataFrame, snapshot_path: str, filter_manager: FilterManager, logger):
+    """Worker-thread body for MainWindow's close-time archive snapshot."""
+    try:
+        export_to_excel_formatted(df, snapshot_path, filter_manager, split_sheets=True)
+    except Exception:
+        logger.exception("Error saving final snapshot")
 
 
 class MainWindow(QMainWindow):
@@ -273,6 +285,26 @@ class MainWindow(QMainWindow):
             self.child_windows = []
             self._extra_models: List[DataFrameModel] = []
             self._filtered_tab_show_matches = True
+            self._last_union_mask = None
+            self._nav_sig = None
+            # Monotonic stamp given to a tab each time its filter list is replaced.
+            self._filters_version = 0
+            # _snapshot_key() of the last archive snapshot written.
+            self._archived_snapshot_key = None
+            self._last_header_filename: Optional[str] = None
+
+            # Coalesced UI refreshes, flushed once per event-loop tick.
+            self._ui_refresh_pending: Set[str] = set()
+            self._ui_refresh_timer = QTimer(self)
+            self._ui_refresh_timer.setSingleShot(True)
+            self._ui_refresh_timer.setInterval(0)
+            self._ui_refresh_timer.timeout.connect(self._flush_ui_refresh)
+
+            # Debounced state persistence: bursts of edits write app_state.json once.
+            self._save_timer = QTimer(self)
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(250)
+            self._save_timer.timeout.connect(self._do_save_state)
 
             # Setup
             self.logger.info("Setting up models...")
@@ -361,12 +393,6 @@ class MainWindow(QMainWindow):
         self._filter_panel_user_collapsed = False
         self._filter_panel_auto_collapsed = False
         self._filter_panel_sizes = None
-        self.filter_panel.setStyleSheet(f"""
-            ModernFilterPanel {{
-                background-color: {AppTheme.BACKGROUND};
-                border-right: 1px solid {AppTheme.GRAY_200};
-            }}
-        """)
         content_splitter.addWidget(self.filter_panel)
         self.filter_panel.widthSuggested.connect(self._on_filter_panel_width_suggested)
 
@@ -429,7 +455,7 @@ class MainWindow(QMainWindow):
         self.proxy_all.setFilterMode("all")
         self.table_all.setModel(self.proxy_all)
         self.table_all.tab_kind = "base"
-        self.table_all.tab_filters = []
+        self._set_tab_filters(self.table_all, [])
         self.table_all.tab_filter_mode = "all"
         self.tab_widget.addTab(self.table_all, "All Students")
 
@@ -728,6 +754,7 @@ class MainWindow(QMainWindow):
             
             # Create archive
             archive_path = create_archive_snapshot(self.df, self.model.filter_manager)
+            self._archived_snapshot_key = self._snapshot_key()
             
             filename = os.path.basename(filepath)
             self.status_bar.showMessage(f"Loaded {filename} - Archive: {os.path.basename(archive_path)}", 5000)
@@ -847,6 +874,7 @@ class MainWindow(QMainWindow):
 
             save_last_loaded_file(filepath)
             create_archive_snapshot(self.df, self.model.filter_manager)
+            self._archived_snapshot_key = self._snapshot_key()
             self._save_state()
 
         except Exception as e:
@@ -1098,7 +1126,7 @@ class MainWindow(QMainWindow):
                 return
         self._remove_filter_from_tab(current_widget, filter_rule)
 
-    def _on_filter_edited(self, filter_rule, _new_filter):
+    def _on_filter_edited(self, filter_rule):
         """Edit an existing filter."""
         current_model = self._get_current_model() or self.model
         if current_model is None or current_model.rowCount() == 0:
@@ -1123,7 +1151,7 @@ class MainWindow(QMainWindow):
                     if existing == filter_rule:
                         filters[i] = new_filter
                         break
-                target_widget.tab_filters = filters
+                self._set_tab_filters(target_widget, filters)
                 if getattr(target_widget, "tab_kind", None) == "rule":
                     self._rebuild_rule_tab(target_widget)
                     self._refresh_rule_state()
@@ -1172,7 +1200,7 @@ class MainWindow(QMainWindow):
         # Create snapshot for this rule
         base_df = self.model.dataframe()
         mask = self._build_mask_for_filters(base_df, filter_rules, filter_mode)
-        snapshot_df = base_df[mask].copy() if not base_df.empty else base_df.copy()
+        snapshot_df = base_df[mask] if not base_df.empty else base_df
 
         # Create proxy for snapshot model
         proxy = SmartSearchProxy()
@@ -1182,16 +1210,11 @@ class MainWindow(QMainWindow):
         proxy.setFilterMode("all")
         
         # Apply current search
-        proxy.setSearchText(self.search_edit.text())
-        search_col = self.search_column_combo.currentText()
-        if search_col != "Global" and self._model_has_column(proxy.sourceModel(), search_col):
-            proxy.setSearchColumn(search_col)
-        else:
-            proxy.setSearchColumn(None)
+        self._apply_search_to_proxy(proxy)
         
         table_view.setModel(proxy)
         self._wire_table_view(table_view, allow_filters=True)
-        table_view.tab_filters = list(filter_rules)
+        self._set_tab_filters(table_view, list(filter_rules))
         table_view.tab_filter_mode = filter_mode
         table_view.tab_kind = "rule"
         
@@ -1263,7 +1286,7 @@ class MainWindow(QMainWindow):
         if proxy is None:
             return
 
-        current_name = self._strip_tab_count(self.tab_widget.tabText(index))
+        current_name = self.tab_widget.tabText(index)
         new_name = f"{current_name} Copy"
 
         new_index = self._create_custom_tab(new_name, source_proxy=proxy)
@@ -1524,7 +1547,7 @@ class MainWindow(QMainWindow):
             widget = self.tab_widget.widget(i)
             if widget is None:
                 continue
-            proxy = widget.model() if hasattr(widget, "model") else None
+            proxy = widget.model()
             if isinstance(proxy, SmartSearchProxy):
                 yield i, widget, proxy
 
@@ -1547,6 +1570,14 @@ class MainWindow(QMainWindow):
     def _get_current_tab_widget(self):
         return self.tab_widget.widget(self.tab_widget.currentIndex())
 
+    def _current_tab_context(self):
+        """Return (widget, proxy, source model) for the active tab from a single lookup."""
+        widget = self._get_current_tab_widget()
+        proxy = widget.model() if widget is not None else None
+        if not isinstance(proxy, SmartSearchProxy):
+            return widget, None, None
+        return widget, proxy, proxy.sourceModel()
+
     def _set_tab_visible(self, index: int, visible: bool):
         tab_bar = self.tab_widget.tabBar()
         if hasattr(tab_bar, "setTabVisible"):
@@ -1570,9 +1601,10 @@ class MainWindow(QMainWindow):
             self.tab_widget.setCurrentIndex(0)
 
     def _iter_rule_tabs(self):
+        # Every tab page is a StyledTableView, which defines tab_kind.
         for i in range(self.tab_widget.count()):
             widget = self.tab_widget.widget(i)
-            if getattr(widget, "tab_kind", None) == "rule":
+            if widget.tab_kind == "rule":
                 yield i, widget
 
     def _get_rule_definitions(self):
@@ -1608,48 +1640,33 @@ class MainWindow(QMainWindow):
                 active_filters.extend(filters)
         return active_filters
 
-    def _row_matches_filters(self, row, filters, mode: str) -> bool:
-        if not filters:
-            return False
-
-        applicable = []
-        for filter_rule in filters:
-            col = getattr(filter_rule, "column", None)
-            if col is None:
-                continue
-            if col in row.index:
-                applicable.append(filter_rule)
+    def _build_mask_for_filters(self, df: pd.DataFrame, filters, mode: str) -> np.ndarray:
+        if df is None or df.empty or not filters:
+            return np.zeros(len(df) if df is not None else 0, dtype=bool)
 
+        applicable = [f for f in filters if getattr(f, "column", None) in df.columns]
         if not applicable:
-            return False
-
-        if mode == "any":
-            for filter_rule in applicable:
-                col = filter_rule.column
-                try:
-                    if filter_rule.matches(row[col]):
-                        return True
-                except Exception:
-                    continue
-            return False
+            return np.zeros(len(df), dtype=bool)
 
-        # Default AND
+        # One vectorized pass per rule instead of a Python call per row,
+        # folded into a single accumulator so only two masks are ever live.
+        combine = np.logical_or if mode == "any" else np.logical_and
+        combined = None
         for filter_rule in applicable:
-            col = filter_rule.column
+            series = df[filter_rule.column]
             try:
-                if not filter_rule.matches(row[col]):
-                    return False
+                mask = filter_rule.vector_mask(series)
             except Exception:
-                return False
-        return True
-
-    def _build_mask_for_filters(self, df: pd.DataFrame, filters, mode: str) -> np.ndarray:
-        if df is None or df.empty or not filters:
-            return np.array([False] * (len(df) if df is not None else 0), dtype=bool)
-        mask = []
-        for _, row in df.iterrows():
-            mask.append(self._row_matches_filters(row, filters, mode))
-        return np.array(mask, dtype=bool)
+                mask = FilterRule.vector_mask(filter_rule, series)
+            if combined is None:
+                combined = np.array(mask, dtype=bool)
+            else:
+                combine(combined, mask, out=combined)
+            # Stop once further rules cannot change the result.
+            settled = combined.all() if mode == "any" else not combined.any()
+            if settled:
+                break
+        return combined
 
     def _build_union_rule_mask(self, df: pd.DataFrame, combine_mode: str = "any") -> np.ndarray:
         """Build highlight mask for base tab from all rule tab filters.
@@ -1659,26 +1676,58 @@ class MainWindow(QMainWindow):
             combine_mode: "any" for OR (union), "all" for AND (intersection)
         """
         if df is None or df.empty:
-            return np.array([], dtype=bool)
+            return _EMPTY_BOOL_MASK
         rules = self._get_rule_definitions()
         if not rules:
-            return np.array([False] * len(df), dtype=bool)
+            return np.zeros(len(df), dtype=bool)
 
         if combine_mode == "all":
             # AND mode: row must match ALL rule tabs
-            combined_mask = np.array([True] * len(df), dtype=bool)
+            combined_mask = np.ones(len(df), dtype=bool)
             for filters, mode in rules:
                 rule_mask = self._build_mask_for_filters(df, filters, mode)
                 combined_mask = np.logical_and(combined_mask, rule_mask)
             return combined_mask
         else:
             # OR mode (default): row must match ANY rule tab
-            union_mask = np.array([False] * len(df), dtype=bool)
+            union_mask = np.zeros(len(df), dtype=bool)
             for filters, mode in rules:
                 rule_mask = self._build_mask_for_filters(df, filters, mode)
                 union_mask = np.logical_or(union_mask, rule_mask)
             return union_mask
 
+    def _union_mask_key(self, combine_mode: str):
+        """Identify the inputs of the base-tab union mask (data version + rules)."""
+        rules = []
+        for _, widget in self._iter_rule_tabs():
+            filters, mode = self._ensure_tab_filter_state(widget)
+            if filters:
+                rules.append((widget.tab_filters_version, mode))
+        return (self.model.data_version(), combine_mode, tuple(rules))
+
+    def _cached_union_mask(self, combine_mode: str) -> np.ndarray:
+        """Base-tab union mask, rebuilt only when the data or rule set changed."""
+        key = self._union_mask_key(combine_mode)
+        cached = self._last_union_mask
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        union_mask = self._build_union_rule_mask(self.model.dataframe(), combine_mode=combine_mode)
+        self._last_union_mask = (key, union_mask)
+        return union_mask
+
+    def _cached_tab_mask(self, widget, model: DataFrameModel, filters, mode: str) -> np.ndarray:
+        """Mask for a custom/file tab's own filters, reused until its data or filters change.
+
+        The cache lives on the tab widget (like tab_filters) so it goes away with the tab.
+        """
+        key = (id(model), model.data_version(), getattr(widget, "tab_filters_version", None), mode)
+        cached = getattr(widget, "tab_mask_cache", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        mask = self._build_mask_for_filters(model.dataframe(), filters, mode)
+        widget.tab_mask_cache = (key, mask)
+        return mask
+
     def _set_proxy_source_dataframe(self, proxy: SmartSearchProxy, df: pd.DataFrame):
         """Update a proxy's source data without swapping model objects when possible."""
         if not isinstance(proxy, SmartSearchProxy):
@@ -1700,8 +1749,7 @@ class MainWindow(QMainWindow):
         source_model = proxy.sourceModel() if proxy and hasattr(proxy, "sourceModel") else None
         if not isinstance(source_model, DataFrameModel):
             return
-        df = source_model.dataframe()
-        if df is None or df.empty:
+        if source_model.rowCount() == 0 or source_model.columnCount() == 0:
             source_model.set_highlight_mask(None)
             source_model.filter_manager.clear_all()
             return
@@ -1712,42 +1760,42 @@ class MainWindow(QMainWindow):
             source_model.filter_manager.clear_all()
             return
 
-        applicable = [f for f in filters if getattr(f, "column", None) in df.columns]
+        columns = source_model.column_name_set()
+        applicable = [f for f in filters if getattr(f, "column", None) in columns]
         if not applicable:
             source_model.set_highlight_mask(None)
             source_model.filter_manager.clear_all()
             return
 
-        mask = self._build_mask_for_filters(df, applicable, mode)
+        mask = self._cached_tab_mask(widget, source_model, filters, mode)
         source_model.set_highlight_mask(mask)
-        source_model.filter_manager.clear_all()
-        for filter_rule in applicable:
-            source_model.filter_manager.add_filter(filter_rule)
+        source_model.filter_manager.set_filters(applicable)
 
     def _refresh_rule_state(self):
         """Recompute main-tab highlights and filtered tab based on rules."""
-        df = self.model.dataframe()
-        if df.empty:
+        rule_definitions = self._get_rule_definitions()
+        if self.model.rowCount() == 0:
+            self._last_union_mask = None
             self.model.set_highlight_mask(None)
             self.model.filter_manager.clear_all()
-            self._rebuild_unmatched_tab(np.array([], dtype=bool))
-            self._refresh_all_views()
+            self._rebuild_unmatched_tab(_EMPTY_BOOL_MASK)
+            self._schedule_ui_refresh("views")
             return
 
         # Get the base tab's combine mode for determining how rule tabs are combined
         base_tab_mode = getattr(self.table_all, "tab_filter_mode", "any")
-        union_mask = self._build_union_rule_mask(df, combine_mode=base_tab_mode)
+        union_mask = self._cached_union_mask(base_tab_mode)
         self.model.set_highlight_mask(union_mask)
 
         # Update main filter_manager with all rule filters (cell-level highlights only).
-        self.model.filter_manager.clear_all()
-        for filters, _ in self._get_rule_definitions():
-            for filter_rule in filters:
-                self.model.filter_manager.add_filter(filter_rule)
+        self.model.filter_manager.set_filters(
+            filter_rule
+            for filters, _ in rule_definitions
+            for filter_rule in filters
+        )
 
         self._rebuild_unmatched_tab(union_mask)
-        self._refresh_all_views()
-        self._update_ui_state()
+        self._schedule_ui_refresh("views", "ui_state")
 
     def _rebuild_rule_tab(self, widget):
         if widget is None:
@@ -1755,7 +1803,7 @@ class MainWindow(QMainWindow):
         filters, mode = self._ensure_tab_filter_state(widget)
         base_df = self.model.dataframe()
         mask = self._build_mask_for_filters(base_df, filters, mode)
-        snapshot_df = base_df[mask].copy() if not base_df.empty else base_df.copy()
+        snapshot_df = base_df[mask] if not base_df.empty else base_df
 
         proxy = widget.model() if hasattr(widget, "model") else None
         if not isinstance(proxy, SmartSearchProxy):
@@ -1765,13 +1813,8 @@ class MainWindow(QMainWindow):
         proxy.setExtraFilters([])
 
         # Preserve current search settings
-        proxy.setSearchText(self.search_edit.text())
-        search_col = self.search_column_combo.currentText()
+        self._apply_search_to_proxy(proxy)
         source_model = proxy.sourceModel()
-        if search_col != "Global" and self._model_has_column(source_model, search_col):
-            proxy.setSearchColumn(search_col)
-        else:
-            proxy.setSearchColumn(None)
 
         if widget is self._get_current_tab_widget():
             self._update_search_columns(source_model)
@@ -1789,7 +1832,7 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage(f"Filtered tab now shows {mode_text} rows", 3000)
         self._refresh_rule_state()
         self._sync_active_tab_context()
-        self._save_state()
+        self._schedule_ui_refresh("save_state")
 
     def _ensure_filtered_tab(self):
         """Ensure the Filtered tab exists."""
@@ -1805,7 +1848,7 @@ class MainWindow(QMainWindow):
         table_view.setModel(proxy)
         self._wire_table_view(table_view, allow_filters=False)
         table_view.tab_kind = "filtered"
-        table_view.tab_filters = []
+        self._set_tab_filters(table_view, [])
         table_view.tab_filter_mode = "all"
 
         insert_index = 1 if self.tab_widget.count() > 1 else self.tab_widget.count()
@@ -1820,27 +1863,24 @@ class MainWindow(QMainWindow):
     def _rebuild_filtered_tab(self, union_mask: np.ndarray):
         """Rebuild the Filtered tab with matching or non-matching rows."""
         index, widget = self._ensure_filtered_tab()
+        # dataframe() already hands back a private copy and boolean indexing
+        # copies again, so the snapshot needs no extra .copy().
         df = self.model.dataframe()
         if df.empty:
-            snapshot_df = df.copy()
+            snapshot_df = df
         else:
             if union_mask is None or len(union_mask) != len(df):
-                snapshot_df = df.iloc[0:0].copy()
+                snapshot_df = df.iloc[0:0]
             else:
                 target_mask = union_mask if self._filtered_tab_show_matches else np.logical_not(union_mask)
-                snapshot_df = df[target_mask].copy() if target_mask.any() else df.iloc[0:0].copy()
+                snapshot_df = df[target_mask] if target_mask.any() else df.iloc[0:0]
 
         proxy = widget.model() if hasattr(widget, "model") else None
         if isinstance(proxy, SmartSearchProxy):
             self._set_proxy_source_dataframe(proxy, snapshot_df)
             proxy.setExtraFilters([])
-            proxy.setSearchText(self.search_edit.text())
-            search_col = self.search_column_combo.currentText()
+            self._apply_search_to_proxy(proxy)
             source_model = proxy.sourceModel()
-            if search_col != "Global" and self._model_has_column(source_model, search_col):
-                proxy.setSearchColumn(search_col)
-            else:
-                proxy.setSearchColumn(None)
             if widget is self._get_current_tab_widget():
                 self._update_search_columns(source_model)
                 self._update_column_navigator(source_model)
@@ -1854,13 +1894,18 @@ class MainWindow(QMainWindow):
     def _rebuild_unmatched_tab(self, union_mask: np.ndarray):
         """Legacy method - redirects to filtered tab."""
         self._rebuild_filtered_tab(union_mask)
+
+    def _set_tab_filters(self, widget, filters):
+        """Assign a tab's filter list and stamp it with a fresh version for cache keys."""
+        widget.tab_filters = filters
+        self._filters_version += 1
+        widget.tab_filters_version = self._filters_version
+
     def _ensure_tab_filter_state(self, widget):
         if widget is None:
             return [], "all"
         if not hasattr(widget, "tab_filters"):
-            widget.tab_filters = []
-        if not hasattr(widget, "tab_filter_mode"):
-            widget.tab_filter_mode = "all"
+            self._set_tab_filters(widget, [])
         return widget.tab_filters, widget.tab_filter_mode
 
     def _apply_tab_filters(self, widget):
@@ -1891,6 +1936,10 @@ class MainWindow(QMainWindow):
         self._apply_tab_highlights(widget)
 
     def _sync_filter_panel_for_tab(self, widget):
+        with self.filter_panel.batch():
+            self._fill_filter_panel_for_tab(widget)
+
+    def _fill_filter_panel_for_tab(self, widget):
         self.filter_panel.clear_all_chips()
         if widget is None:
             return
@@ -1904,14 +1953,12 @@ class MainWindow(QMainWindow):
                 for filter_rule in rule_filters:
                     if filter_rule not in display_filters:
                         display_filters.append(filter_rule)
-            for filter_rule in display_filters:
-                self.filter_panel.add_filter_chip(filter_rule)
+            self.filter_panel.add_filters(display_filters)
             self.filter_panel.set_filter_mode(mode)
             return
 
         filters, mode = self._ensure_tab_filter_state(widget)
-        for filter_rule in filters:
-            self.filter_panel.add_filter_chip(filter_rule)
+        self.filter_panel.add_filters(filters)
         self.filter_panel.set_filter_mode(mode)
 
     def _add_filter_to_tab(self, widget, filter_rule):
@@ -1921,24 +1968,20 @@ class MainWindow(QMainWindow):
         if filter_rule in filters:
             return
         filters.append(filter_rule)
-        widget.tab_filters = filters
+        self._set_tab_filters(widget, filters)
         if getattr(widget, "tab_kind", None) == "rule":
             self._rebuild_rule_tab(widget)
             self._refresh_rule_state()
         else:
             self._apply_tab_filters(widget)
-        if widget is self._get_current_tab_widget():
-            self._sync_filter_panel_for_tab(widget)
-        self._update_column_navigator()
-        self._update_ui_state()
-        self._save_state()
+        self._schedule_ui_refresh("filter_panel", "column_navigator", "ui_state", "save_state")
 
     def _remove_filter_from_tab(self, widget, filter_rule):
         if widget is None or filter_rule is None:
             return
         filters, mode = self._ensure_tab_filter_state(widget)
         new_filters = [f for f in filters if f != filter_rule]
-        widget.tab_filters = new_filters
+        self._set_tab_filters(widget, new_filters)
         if getattr(widget, "tab_kind", None) == "rule":
             if not new_filters:
                 index = self.tab_widget.indexOf(widget)
@@ -1947,22 +1990,18 @@ class MainWindow(QMainWindow):
                     widget.deleteLater()
                 self._refresh_rule_state()
                 self._sync_active_tab_context()
-                self._save_state()
+                self._schedule_ui_refresh("save_state")
                 return
             self._rebuild_rule_tab(widget)
             self._refresh_rule_state()
         else:
             self._apply_tab_filters(widget)
-        if widget is self._get_current_tab_widget():
-            self._sync_filter_panel_for_tab(widget)
-        self._update_column_navigator()
-        self._update_ui_state()
-        self._save_state()
+        self._schedule_ui_refresh("filter_panel", "column_navigator", "ui_state", "save_state")
 
     def _clear_filters_for_tab(self, widget):
         if widget is None:
             return
-        widget.tab_filters = []
+        self._set_tab_filters(widget, [])
         if getattr(widget, "tab_kind", None) == "rule":
             index = self.tab_widget.indexOf(widget)
             if index > 0:
@@ -1970,15 +2009,11 @@ class MainWindow(QMainWindow):
                 widget.deleteLater()
             self._refresh_rule_state()
             self._sync_active_tab_context()
-            self._save_state()
+            self._schedule_ui_refresh("save_state")
             return
         else:
             self._apply_tab_filters(widget)
-        if widget is self._get_current_tab_widget():
-            self._sync_filter_panel_for_tab(widget)
-        self._update_column_navigator()
-        self._update_ui_state()
-        self._save_state()
+        self._schedule_ui_refresh("filter_panel", "column_navigator", "ui_state", "save_state")
 
     def _set_tab_filter_mode(self, widget, mode: str):
         if widget is None:
@@ -1995,11 +2030,7 @@ class MainWindow(QMainWindow):
             self._refresh_rule_state()
         else:
             self._apply_tab_filters(widget)
-        if widget is self._get_current_tab_widget():
-            self._sync_filter_panel_for_tab(widget)
-        self._update_column_navigator()
-        self._update_ui_state()
-        self._save_state()
+        self._schedule_ui_refresh("filter_panel", "column_navigator", "ui_state", "save_state")
 
     def _get_tab_filter_context(self, widget):
         """Return (FilterManager, mode) for the given tab."""
@@ -2009,14 +2040,15 @@ class MainWindow(QMainWindow):
 
         tab_kind = getattr(widget, "tab_kind", None)
         if tab_kind in ["base", "filtered"]:
-            for filters, _ in self._get_rule_definitions():
-                for filter_rule in filters:
-                    filter_manager.add_filter(filter_rule)
+            filter_manager.set_filters(
+                filter_rule
+                for filters, _ in self._get_rule_definitions()
+                for filter_rule in filters
+            )
             return filter_manager, "any"
 
         filters, mode = self._ensure_tab_filter_state(widget)
-        for filter_rule in filters:
-            filter_manager.add_filter(filter_rule)
+        filter_manager.set_filters(filters)
         return filter_manager, mode
 
     def _proxy_is_main_model(self, proxy: Optional[SmartSearchProxy]) -> bool:
@@ -2028,18 +2060,10 @@ class MainWindow(QMainWindow):
         if model is None:
             return False
         try:
-            return column in model.dataframe().columns
+            return column in model.column_name_set()
         except Exception:
             return False
 
-    def _strip_tab_count(self, text: str) -> str:
-        if not text:
-            return ""
-        if "(" in text and text.rstrip().endswith(")"):
-            base = text[:text.rfind("(")].strip()
-            return base if base else text
-        return text
-
     def _wire_table_view(self, table_view: StyledTableView, allow_filters: bool = True):
         table_view.cellEditRequested.connect(self._on_edit_cell)
         table_view.allow_column_filters = allow_filters
@@ -2076,16 +2100,15 @@ class MainWindow(QMainWindow):
         if current_widget is None or getattr(current_widget, "tab_kind", None) != "base":
             return None
 
-        base_df = self.model.dataframe()
         base_tab_mode = getattr(self.table_all, "tab_filter_mode", "any")
-        union_mask = self._build_union_rule_mask(base_df, combine_mode=base_tab_mode)
+        union_mask = self._cached_union_mask(base_tab_mode)
         if proxy is None:
             return union_mask
 
         rows = self._visible_source_rows(proxy)
         if rows:
             try:
-                return union_mask[rows]
+                return union_mask[np.asarray(rows, dtype=np.intp)]
             except Exception:
                 return union_mask
         return union_mask
@@ -2208,23 +2231,20 @@ class MainWindow(QMainWindow):
 
     def _apply_search_to_all_tabs(self):
         """Apply current search settings to all proxies safely."""
-        text = self.search_edit.text()
-        selected = self.search_column_combo.currentText()
-        column = None if selected == "Global" else selected
-        
         for _, _, proxy in self._iter_tab_proxies():
-            proxy.setSearchText(text)
-            if column is None:
-                proxy.setSearchColumn(None)
-            else:
-                if self._model_has_column(proxy.sourceModel(), column):
-                    proxy.setSearchColumn(column)
-                else:
-                    proxy.setSearchColumn(None)
+            self._apply_search_to_proxy(proxy)
         
         self._update_tab_counts()
         self._update_ui_state()
 
+    def _apply_search_to_proxy(self, proxy: SmartSearchProxy):
+        """Push the search bar's text/column onto one proxy in a single re-filter."""
+        selected = self.search_column_combo.currentText()
+        column = None
+        if selected != "Global" and self._model_has_column(proxy.sourceModel(), selected):
+            column = selected
+        proxy.setSearch(self.search_edit.text(), column)
+
     def _on_filter_panel_width_suggested(self, suggested_width: int):
         if getattr(self, "_filter_panel_collapsed", False):
             return
@@ -2245,9 +2265,9 @@ class MainWindow(QMainWindow):
         # New custom tabs are independent snapshots of the current view.
         source_proxy = source_proxy or self._get_current_proxy()
         if source_proxy is not None:
-            snapshot_df = self._dataframe_for_proxy(source_proxy).copy().reset_index(drop=True)
+            snapshot_df = self._dataframe_for_proxy(source_proxy).reset_index(drop=True)
         else:
-            snapshot_df = self.model.dataframe().copy().reset_index(drop=True)
+            snapshot_df = self.model.dataframe().reset_index(drop=True)
 
         table_view = StyledTableView()
         new_model = DataFrameModel(snapshot_df)
@@ -2258,7 +2278,7 @@ class MainWindow(QMainWindow):
         table_view.setModel(proxy)
         self._wire_table_view(table_view, allow_filters=True)
         table_view.tab_kind = "custom"
-        table_view.tab_filters = []
+        self._set_tab_filters(table_view, [])
         table_view.tab_filter_mode = "all"
 
         self._extra_models.append(new_model)
@@ -2279,16 +2299,13 @@ class MainWindow(QMainWindow):
         new_proxy.setFilterMode("all")
         
         # Apply current search settings
-        new_proxy.setSearchText(self.search_edit.text())
-        search_col = self.search_column_combo.currentText()
-        if search_col != "Global" and self._model_has_column(new_model, search_col):
-            new_proxy.setSearchColumn(search_col)
+        self._apply_search_to_proxy(new_proxy)
         
         table_view.setModel(new_proxy)
         self._wire_table_view(table_view, allow_filters=False)
         table_view.tab_kind = "file"
         table_view.file_path = filepath
-        table_view.tab_filters = []
+        self._set_tab_filters(table_view, [])
         table_view.tab_filter_mode = "all"
         
         self._extra_models.append(new_model)
@@ -2309,8 +2326,8 @@ class MainWindow(QMainWindow):
                 df, _, _ = load_dataframe_from_file(filepath, sheet_name=sheets[0])
             df = add_date_column(df)
             return self._create_file_tab(df, filepath, tab_name=tab_name, insert_index=insert_index)
-        except Exception as e:
-            print(f"Error restoring file tab {filepath}: {e}")
+        except Exception:
+            self.logger.exception("Error restoring file tab %s", filepath)
             return None
 
     def _filter_from_dict(self, filter_data: dict) -> Optional[FilterRule]:
@@ -2323,6 +2340,15 @@ class MainWindow(QMainWindow):
             return DateFilter.from_dict(filter_data)
         return None
 
+    def _restore_tab_filters(self, widget, filters, mode: str):
+        """Apply restored filters to a tab, skipping the re-filter when nothing changes."""
+        current_filters, current_mode = self._ensure_tab_filter_state(widget)
+        if filters == current_filters and mode == current_mode:
+            return
+        self._set_tab_filters(widget, filters)
+        widget.tab_filter_mode = mode
+        self._apply_tab_filters(widget)
+
     def _restore_tabs_from_state(self):
         """Restore tabs from saved state."""
         tabs = getattr(self, "_pending_tabs", [])
@@ -2339,7 +2365,7 @@ class MainWindow(QMainWindow):
         # Reset filters for base tab
         base_widget = self.tab_widget.widget(0)
         if base_widget:
-            base_widget.tab_filters = []
+            self._set_tab_filters(base_widget, [])
             base_widget.tab_filter_mode = "all"
         self.filter_panel.clear_all_chips()
         
@@ -2389,9 +2415,7 @@ class MainWindow(QMainWindow):
                     widget = self.tab_widget.widget(new_index)
                     filtered = [f for f in filters if self._model_has_column(self.model, f.column)]
                     if widget is not None and filtered:
-                        widget.tab_filters = filtered
-                        widget.tab_filter_mode = filter_mode
-                        self._apply_tab_filters(widget)
+                        self._restore_tab_filters(widget, filtered, filter_mode)
                     insert_index += 1
             
             elif tab_type == "file":
@@ -2406,9 +2430,7 @@ class MainWindow(QMainWindow):
                             filtered = [f for f in filters if self._model_has_column(source_model, f.column)]
                         else:
                             filtered = filters
-                        widget.tab_filters = filtered
-                        widget.tab_filter_mode = filter_mode
-                        self._apply_tab_filters(widget)
+                        self._restore_tab_filters(widget, filtered, filter_mode)
                     insert_index += 1
 
         self._pending_tabs = []
@@ -2421,9 +2443,9 @@ class MainWindow(QMainWindow):
         active_model = model or self._get_current_model() or self.model
 
         columns = []
-        if active_model is not None and active_model.rowCount() >= 0:
+        if active_model is not None:
             try:
-                columns = [str(c) for c in active_model.dataframe().columns]
+                columns = active_model.column_names_str()
             except Exception:
                 columns = []
 
@@ -2436,36 +2458,44 @@ class MainWindow(QMainWindow):
         active_model = model or self._get_current_model() or self.model
         
         if active_model is None or active_model.rowCount() == 0:
-            self.column_navigator.set_columns([], {}, set())
+            self._set_navigator_columns([], {}, set())
             return
         
         try:
-            columns = [str(c) for c in active_model.dataframe().columns]
+            columns, column_types = active_model.cached_schema()
         except Exception:
-            columns = []
-        
-        column_types = {}
-        for col in columns:
-            column_types[col] = active_model.get_column_dtype(col)
+            columns, column_types = [], {}
         
         filtered_columns = set()
         current_widget = self._get_current_tab_widget()
         tab_kind = getattr(current_widget, "tab_kind", None) if current_widget is not None else None
         if tab_kind in ["base", "filtered"]:
-            for filters, _ in self._get_rule_definitions():
-                for filter_rule in filters:
-                    filtered_columns.add(filter_rule.column)
+            # Read the rule tabs directly: this runs before _refresh_rule_state
+            # when a rule tab is created, restored or the data changes.
+            filtered_columns = {
+                filter_rule.column
+                for filters, _ in self._get_rule_definitions()
+                for filter_rule in filters
+            }
         elif current_widget is not None:
             filters, _ = self._ensure_tab_filter_state(current_widget)
             for filter_rule in filters:
                 filtered_columns.add(filter_rule.column)
         
+        self._set_navigator_columns(columns, column_types, filtered_columns)
+
+    def _set_navigator_columns(self, columns, column_types, filtered_columns):
+        """Push columns to the navigator, skipping the widget rebuild when nothing changed."""
+        sig = (tuple(columns), tuple(column_types.items()), frozenset(filtered_columns))
+        if sig == self._nav_sig:
+            return
+        self._nav_sig = sig
         self.column_navigator.set_columns(columns, column_types, filtered_columns)
     
     def _update_ui_state(self):
         """Update modern UI elements based on current state."""
-        current_proxy = self._get_current_proxy()
-        current_model = self._get_current_model() or self.model
+        current_widget, current_proxy, current_model = self._current_tab_context()
+        current_model = current_model or self.model
         total_rows = current_model.rowCount() if current_model else 0
         visible_rows = current_proxy.rowCount() if current_proxy else total_rows
 
@@ -2473,8 +2503,7 @@ class MainWindow(QMainWindow):
         self.header.update_row_count(visible_rows, total_rows)
 
         # Update filter count in header
-        current_widget = self._get_current_tab_widget()
-        tab_kind = getattr(current_widget, "tab_kind", None) if current_widget is not None else None
+        tab_kind = getattr(current_widget, "tab_kind", None)
         if tab_kind in ["base", "filtered"]:
             rule_count = len(self._get_rule_definitions())
             self.header.update_filter_count(rule_count)
@@ -2482,65 +2511,90 @@ class MainWindow(QMainWindow):
             filters, _ = self._ensure_tab_filter_state(current_widget)
             self.header.update_filter_count(len(filters))
 
-        # Update file name in header
-        current_widget = self.tab_widget.widget(self.tab_widget.currentIndex())
-        file_path = getattr(current_widget, "file_path", None)
-        if file_path:
-            self.header.update_file_name(os.path.basename(file_path))
-        elif self.current_file_path:
-            self.header.update_file_name(os.path.basename(self.current_file_path))
-        else:
-            self.header.update_file_name("No file")
+        # Update file name in header (only when it actually changes)
+        file_path = getattr(current_widget, "file_path", None) or self.current_file_path
+        filename = os.path.basename(file_path) if file_path else "No file"
+        if filename != self._last_header_filename:
+            self._last_header_filename = filename
+            self.header.update_file_name(filename)
 
         self._update_tab_counts()
 
     def _update_tab_counts(self):
         """Update tab tooltips with row counts (NOT in tab name)."""
+        tab_widget = self.tab_widget
         for index, widget, proxy in self._iter_tab_proxies():
-            count = proxy.get_visible_row_count()
-            current_text = self._strip_tab_count(self.tab_widget.tabText(index))
-            # Don't add count to tab name - just update tooltip
-            self.tab_widget.setTabText(index, current_text)
-            self.tab_widget.setTabToolTip(index, f"{count:,} rows")
+            # The count only goes in the tooltip, so tab names are left exactly
+            # as the user set them. Skip the setter when nothing changed.
+            tooltip = f"{proxy.get_visible_row_count():,} rows"
+            if tab_widget.tabToolTip(index) != tooltip:
+                tab_widget.setTabToolTip(index, tooltip)
     
     def _compute_highlight_mask(self):
         """Compute boolean mask of filtered (matched) rows."""
-        current_widget = self._get_current_tab_widget()
-        tab_kind = getattr(current_widget, "tab_kind", None) if current_widget is not None else None
+        current_widget, _, current_model = self._current_tab_context()
+        tab_kind = getattr(current_widget, "tab_kind", None)
 
         if tab_kind == "base":
-            df = self.model.dataframe()
             base_tab_mode = getattr(self.table_all, "tab_filter_mode", "any")
-            return self._build_union_rule_mask(df, combine_mode=base_tab_mode)
+            return self._cached_union_mask(base_tab_mode)
 
-        current_model = self._get_current_model() or self.model
+        current_model = current_model or self.model
         if current_model is None:
-            return np.array([], dtype=bool)
-        df = current_model.dataframe()
-        if df.empty:
-            return np.array([], dtype=bool)
+            return _EMPTY_BOOL_MASK
+        row_count = current_model.rowCount()
+        if row_count == 0:
+            return _EMPTY_BOOL_MASK
 
         if tab_kind == "filtered":
-            return np.array([False] * len(df), dtype=bool)
+            return np.zeros(row_count, dtype=bool)
 
         filters, mode = self._ensure_tab_filter_state(current_widget)
-        return self._build_mask_for_filters(df, filters, mode)
+        return self._cached_tab_mask(current_widget, current_model, filters, mode)
     
+    def _schedule_ui_refresh(self, *kinds: str):
+        """Queue UI refresh work so repeated requests run once per event-loop tick.
+
+        Kinds: "views", "column_navigator", "filter_panel", "ui_state", "save_state".
+        """
+        self._ui_refresh_pending.update(kinds)
+        if not self._ui_refresh_timer.isActive():
+            self._ui_refresh_timer.start()
+
+    def _flush_ui_refresh(self):
+        """Run each queued refresh once, in dependency order."""
+        pending, self._ui_refresh_pending = self._ui_refresh_pending, set()
+        if "views" in pending:
+            self._refresh_all_views()
+        if "filter_panel" in pending:
+            current_widget = self._get_current_tab_widget()
+            if current_widget is not None and getattr(current_widget, "tab_kind", None) != "filtered":
+                self._sync_filter_panel_for_tab(current_widget)
+        if "column_navigator" in pending:
+            self._update_column_navigator()
+        if "ui_state" in pending:
+            self._update_ui_state()
+        if "save_state" in pending:
+            self._save_state()
+
     def _refresh_all_views(self):
         """Refresh all proxy filters."""
-        for _, _, proxy in self._iter_tab_proxies():
-            proxy.invalidateFilter()
-        
-        if not self.df.empty:
-            top_left = self.model.index(0, 0)
-            bottom_right = self.model.index(
-                self.model.rowCount() - 1,
-                self.model.columnCount() - 1
-            )
-            self.model.dataChanged.emit(top_left, bottom_right, [Qt.BackgroundRole, Qt.ForegroundRole])
+        for _, widget, proxy in self._iter_tab_proxies():
+            # A proxy with no search, highlight mode or per-tab filters
+            # accepts every row, so re-filtering it would be a no-op pass.
+            if proxy.search_text or proxy.extra_filters or proxy.filter_mode != "all":
+                proxy.invalidateFilter()
+            # Views query roles lazily on paint, so repainting the viewport is
+            # enough to pick up new highlight colours without a per-cell signal.
+            widget.viewport().update()
     
     def _save_state(self):
+        """Schedule a state save; repeated calls within 250 ms write once."""
+        self._save_timer.start()
+
+    def _do_save_state(self):
         """Save application state to disk."""
+        self._save_timer.stop()
         if not hasattr(self, 'model'):
             return
         
@@ -2552,22 +2606,22 @@ class MainWindow(QMainWindow):
         
         # Save tab names
         for i in range(self.tab_widget.count()):
-            tab_text = self._strip_tab_count(self.tab_widget.tabText(i))
+            tab_text = self.tab_widget.tabText(i)
             widget = self.tab_widget.widget(i)
+            tab_kind = widget.tab_kind
 
-            if getattr(widget, "tab_kind", None) == "filtered":
+            if tab_kind == "filtered":
                 continue
 
             entry = {'name': tab_text}
-            filters = list(getattr(widget, "tab_filters", [])) if widget is not None else []
-            entry['filters'] = [f.to_dict() for f in filters]
-            entry['filter_mode'] = getattr(widget, "tab_filter_mode", "all")
+            entry['filters'] = [f.to_dict() for f in getattr(widget, "tab_filters", ())]
+            entry['filter_mode'] = widget.tab_filter_mode
             
             if i == 0:
                 entry['type'] = 'base'
-            elif getattr(widget, "tab_kind", None) == "rule":
+            elif tab_kind == "rule":
                 entry['type'] = 'rule'
-            elif getattr(widget, "tab_kind", None) == "file" and getattr(widget, "file_path", None):
+            elif tab_kind == "file" and widget.file_path:
                 entry['type'] = 'file'
                 entry['file_path'] = widget.file_path
             else:
@@ -2575,11 +2629,12 @@ class MainWindow(QMainWindow):
             
             state['tabs'].append(entry)
         
+        # Write to a temp file and swap it in so a crash mid-write never
+        # leaves a truncated app_state.json behind.
         try:
-            with open('app_state.json', 'w') as f:
-                json.dump(state, f, indent=2)
-        except Exception as e:
-            print(f"Error saving state: {e}")
+            write_json_file_atomic('app_state.json', state)
+        except Exception:
+            self.logger.exception("Error saving state")
     
     def _load_saved_state(self):
         """Load saved application state."""
@@ -2587,8 +2642,7 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            with open('app_state.json', 'r') as f:
-                state = json.load(f)
+            state = read_json_file('app_state.json')
 
             filtered_mode = state.get('filtered_tab_mode', 'matched')
             self._filtered_tab_show_matches = (filtered_mode != 'unmatched')
@@ -2616,8 +2670,8 @@ class MainWindow(QMainWindow):
                     self._pending_base_tab_name = tabs_data[0]
 
         
-        except Exception as e:
-            print(f"Error loading state: {e}")
+        except Exception:
+            self.logger.exception("Error loading state")
     
     def _autoload_last_file(self):
         """Auto-load the last opened file on startup."""
@@ -2646,12 +2700,8 @@ class MainWindow(QMainWindow):
         if not hasattr(self, '_pending_filters') or not self._pending_filters:
             return
         
-        available_columns = set(str(c) for c in self.df.columns)
-
-        legacy_filters = []
-        for filter_rule in self._pending_filters:
-            if filter_rule.column in available_columns:
-                legacy_filters.append(filter_rule)
+        available_columns = self.model.column_name_set()
+        legacy_filters = [f for f in self._pending_filters if f.column in available_columns]
 
         if legacy_filters:
             self._create_filter_tab(
@@ -2668,25 +2718,50 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle window close event."""
-        # Save state
-        self._save_state()
+        # Save state now (supersedes any queued refresh or debounced save)
+        self._ui_refresh_timer.stop()
+        self._ui_refresh_pending.clear()
+        self._do_save_state()
         
-        # Create final snapshot
-        if not self.df.empty:
+        # Create final snapshot, unless nothing changed since the last archive
+        if not self.df.empty and self._snapshot_key() != self._archived_snapshot_key:
             try:
                 import datetime
                 timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
                 
                 os.makedirs("archives", exist_ok=True)
                 snapshot_path = os.path.join("archives", f"snapshot_{timestamp}.xlsx")
-                
-                export_to_excel_formatted(
-                    self.df,
-                    snapshot_path,
-                    self.model.filter_manager,
-                    split_sheets=True
+
+                # The worker gets its own filter manager and copies of the
+                # rules, so later UI teardown cannot change them mid-export.
+                snapshot_filters = FilterManager()
+                snapshot_filters.set_filters(
+                    [copy.copy(rule) for rule in self.model.filter_manager.get_all_filters()]
                 )
-            except Exception as e:
-                print(f"Error saving final snapshot: {e}")
+
+                # Non-daemon: the interpreter waits for it at exit, but the
+                # window closes immediately instead of blocking on openpyxl.
+                # The target is a plain function so the thread does not keep
+                # the closed window alive.
+                threading.Thread(
+                    target=_write_final_snapshot,
+                    args=(self.df, snapshot_path, snapshot_filters, self.logger),
+                    name="final-snapshot",
+                    daemon=False,
+                ).start()
+            except Exception:
+                self.logger.exception("Error saving final snapshot")
         
         event.accept()
+
+    def _snapshot_key(self):
+        """Identify what an archive snapshot would contain.
+
+        Snapshots export self.df, which is not the model's own frame, so the
+        key covers that object as well as the model data and rule filters.
+        """
+        return (
+            id(self.df),
+            self.model.data_version(),
+            tuple(self.model.filter_manager.get_all_filters()),
+        )
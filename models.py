@@ -7,22 +7,151 @@ import numpy as np
 import pandas as pd
 from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant, pyqtSignal
 from PyQt5.QtGui import QColor, QFont
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 import datetime
+import operator
+import re
+
+from fused_filters import OP_CODES, numeric_and
+
+
+_PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+
+
+def _copy_on_write_enabled() -> bool:
+    """Whether shallow copies are isolated from their source (Copy-on-Write).
+
+    Always on from pandas 3; on pandas 2 it follows the application's own
+    mode.copy_on_write setting, which this module leaves alone.
+    """
+    if _PANDAS_MAJOR >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:  # OptionError: no such option before pandas 1.5
+        return False
+
+
+def _is_missing(value: Any) -> bool:
+    """Cheap scalar NA check (None, NaN, pd.NA, NaT) without calling pd.isna."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return True
+    return isinstance(value, float) and value != value
+
+
+def _coerce_number(value: Any) -> float:
+    """Scalar pd.to_numeric(errors="coerce") for edited cells."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _coerce_timestamp(value: Any):
+    """Scalar pd.to_datetime(errors="coerce") for edited cells."""
+    try:
+        return pd.Timestamp(value)
+    except (TypeError, ValueError, OverflowError):
+        return pd.NaT
+
+
+def _format_value(value: Any) -> str:
+    """DisplayRole text for a cell of any dtype."""
+    if pd.isna(value):
+        return ""
+    elif isinstance(value, float):
+        return f"{value:.4g}"
+    return str(value)
+
+
+def _format_float(value: float) -> str:
+    return "" if value != value else f"{value:.4g}"
+
+
+def _format_timestamp(value) -> str:
+    return "" if value is pd.NaT else str(value)
+
+
+_NS_PER_DAY = 86_400 * 10**9
+
+
+def _date_to_ns(value: datetime.date) -> int:
+    """Epoch nanoseconds for a date, clamped to the datetime64[ns] range."""
+    try:
+        return pd.Timestamp(value).value
+    except (OverflowError, pd.errors.OutOfBoundsDatetime):
+        limits = np.iinfo(np.int64)
+        # min + 1 keeps the NaT sentinel (int64 min) below every bound.
+        return limits.min + 1 if value < datetime.date(1970, 1, 1) else limits.max
 
 
 class FilterRule:
     """Base class for filter rules."""
+    # Rules are read on per-cell paths; slots drop the per-instance __dict__.
+    __slots__ = ("column", "id", "_dict_cache", "_str_cache")
+    
+    # Short type badge shown on filter chips.
+    TAG = "RULE"
+    
     def __init__(self, column: str):
         self.column = column
         self.id = id(self)
     
+    def __setattr__(self, name, value):
+        # Changing any public field invalidates the memoized to_dict() payload
+        # and display text.
+        if not name.startswith("_"):
+            object.__setattr__(self, "_dict_cache", None)
+            object.__setattr__(self, "_str_cache", None)
+        object.__setattr__(self, name, value)
+    
     def matches(self, value: Any) -> bool:
         raise NotImplementedError
     
+    def vector_mask(self, series: pd.Series) -> np.ndarray:
+        """Evaluate the rule against a whole column, returning a bool array.
+
+        Subclasses override this with vectorized pandas/NumPy versions; the
+        base implementation calls matches() once per value.
+        """
+        def _safe(value):
+            try:
+                return bool(self.matches(value))
+            except Exception:
+                return False
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Evaluate each distinct category once and map back through the
+            # codes; the appended entry is what code -1 (missing, read back
+            # as NaN) picks up.
+            hits = self.vector_mask(pd.Series(series.cat.categories))
+            return np.append(hits, _safe(np.nan))[series.cat.codes.to_numpy()]
+        return np.fromiter((_safe(v) for v in series), dtype=bool, count=len(series))
+    
     def to_dict(self) -> dict:
+        """Serializable form of the rule, built once and reused until a field changes.
+
+        The returned dict is shared; callers must treat it as read-only.
+        """
+        cached = getattr(self, "_dict_cache", None)
+        if cached is None:
+            cached = self._build_dict()
+            object.__setattr__(self, "_dict_cache", cached)
+        return cached
+    
+    def _build_dict(self) -> dict:
         raise NotImplementedError
     
+    def __str__(self):
+        # Chips and tab titles format the same rule repeatedly; build it once.
+        cached = getattr(self, "_str_cache", None)
+        if cached is None:
+            cached = self._build_str()
+            object.__setattr__(self, "_str_cache", cached)
+        return cached
+    
+    def _build_str(self) -> str:
+        return object.__str__(self)
+    
     @staticmethod
     def from_dict(data: dict) -> 'FilterRule':
         raise NotImplementedError
@@ -31,6 +160,9 @@ class FilterRule:
 class NumericFilter(FilterRule):
     """Numeric threshold filter (>=, <=, ==, >, <, !=)."""
     
+    __slots__ = ("operator", "value", "_op", "_color", "_threshold")
+    
+    TAG = "NUM"
     OPERATORS = [">=", "<=", "==", ">", "<", "!="]
     COLORS = {
         ">=": QColor(255, 230, 230),
@@ -40,36 +172,70 @@ class NumericFilter(FilterRule):
         "<": QColor(220, 255, 220),
         "!=": QColor(245, 245, 245),
     }
+    DEFAULT_COLOR = QColor(255, 255, 255)
+    
+    UFUNCS = {
+        ">=": np.greater_equal,
+        "<=": np.less_equal,
+        "==": np.equal,
+        ">": np.greater,
+        "<": np.less,
+        "!=": np.not_equal,
+    }
+    
+    OPS = {
+        ">=": operator.ge,
+        "<=": operator.le,
+        "==": operator.eq,
+        ">": operator.gt,
+        "<": operator.lt,
+        "!=": operator.ne,
+    }
     
     def __init__(self, column: str, operator: str, value: float):
         super().__init__(column)
         self.operator = operator
         self.value = value
     
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Keep the comparator, colour and float threshold in step with the
+        # public fields so matches() does no per-call lookups or casts.
+        if name == "operator":
+            self._op = self.OPS.get(value)
+            self._color = self.COLORS.get(value, self.DEFAULT_COLOR)
+        elif name == "value":
+            try:
+                self._threshold = float(value)
+            except (TypeError, ValueError):
+                self._threshold = value
+    
     def matches(self, value: Any) -> bool:
+        if self._op is None:
+            return False
         try:
             val = float(value)
         except (TypeError, ValueError):
             return False
-        
-        if self.operator == ">=":
-            return val >= self.value
-        elif self.operator == "<=":
-            return val <= self.value
-        elif self.operator == "==":
-            return val == self.value
-        elif self.operator == ">":
-            return val > self.value
-        elif self.operator == "<":
-            return val < self.value
-        elif self.operator == "!=":
-            return val != self.value
-        return False
+        # NaN compares False for every operator except "!=", which it passes.
+        return self._op(val, self._threshold)
+    
+    def vector_mask(self, series: pd.Series) -> np.ndarray:
+        ufunc = self.UFUNCS.get(self.operator)
+        if ufunc is None or not pd.api.types.is_numeric_dtype(series.dtype):
+            return super().vector_mask(series)
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        mask = ufunc(values, float(self._threshold))
+        if self.operator == "!=" and not isinstance(series.dtype, np.dtype):
+            # NaN cells pass "!=" as in matches(), but nullable dtypes hold
+            # pd.NA, which float() rejects there, so those cells do not.
+            np.logical_and(mask, series.notna().to_numpy(dtype=bool), out=mask)
+        return mask
     
     def get_color(self) -> QColor:
-        return self.COLORS.get(self.operator, QColor(255, 255, 255))
+        return self._color
     
-    def to_dict(self) -> dict:
+    def _build_dict(self) -> dict:
         return {
             "type": "numeric",
             "column": self.column,
@@ -81,7 +247,7 @@ class NumericFilter(FilterRule):
     def from_dict(data: dict) -> 'NumericFilter':
         return NumericFilter(data["column"], data["operator"], data["value"])
     
-    def __str__(self):
+    def _build_str(self) -> str:
         return f"{self.column} {self.operator} {self.value}"
     
     def __eq__(self, other):
@@ -98,6 +264,9 @@ class NumericFilter(FilterRule):
 class TextFilter(FilterRule):
     """Text contains filter with multiple tokens."""
     
+    __slots__ = ("tokens", "case_sensitive", "_pattern")
+    
+    TAG = "TXT"
     COLOR = QColor(255, 250, 205)
     
     def __init__(self, column: str, tokens: List[str], case_sensitive: bool = False):
@@ -107,20 +276,51 @@ class TextFilter(FilterRule):
         if not self.case_sensitive:
             self.tokens = [t.lower() for t in self.tokens]
     
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("tokens", "case_sensitive"):
+            # One alternation regex scans each value once for every token.
+            tokens = getattr(self, "tokens", None)
+            flags = 0 if getattr(self, "case_sensitive", False) else re.IGNORECASE
+            self._pattern = re.compile("|".join(map(re.escape, tokens)), flags) if tokens else None
+    
     def matches(self, value: Any) -> bool:
-        if not self.tokens:
+        if self._pattern is None:
             return False
-        
-        text = str(value)
-        if not self.case_sensitive:
-            text = text.lower()
-        
-        return any(token in text for token in self.tokens)
+        return self._pattern.search(str(value)) is not None
+    
+    def vector_mask(self, series: pd.Series) -> np.ndarray:
+        if self._pattern is None:
+            return np.zeros(len(series), dtype=bool)
+        if isinstance(series.dtype, pd.CategoricalDtype) or pd.api.types.is_datetime64_any_dtype(series.dtype):
+            # Categoricals are scanned per category by the base class, and
+            # astype(str) formats timestamps differently from str(Timestamp).
+            return super().vector_mask(series)
+        present = series.notna().to_numpy(dtype=bool)
+        text = series if isinstance(series.dtype, pd.StringDtype) else series.astype(str)
+        # String dtypes (including string[pyarrow]) dispatch to native kernels.
+        contains = text.str.contains(
+            self._pattern.pattern, case=self.case_sensitive, regex=True, na=False
+        )
+        mask = contains.to_numpy(dtype=bool) & present
+        if not present.all():
+            # matches() sees missing cells as their str() text ("nan", "None",
+            # "<NA>", "NaT"), which pandas versions disagree on rendering here.
+            # That text depends only on the value's type, so test each once.
+            values = series.to_numpy(dtype=object)
+            hits = {}
+            for i in np.flatnonzero(~present):
+                value = values[i]
+                kind = type(value)
+                if kind not in hits:
+                    hits[kind] = self.matches(value)
+                mask[i] = hits[kind]
+        return mask
     
     def get_color(self) -> QColor:
         return self.COLOR
     
-    def to_dict(self) -> dict:
+    def _build_dict(self) -> dict:
         return {
             "type": "text",
             "column": self.column,
@@ -136,7 +336,7 @@ class TextFilter(FilterRule):
             data.get("case_sensitive", False)
         )
     
-    def __str__(self):
+    def _build_str(self) -> str:
         tokens_str = ", ".join(self.tokens[:3])
         if len(self.tokens) > 3:
             tokens_str += "..."
@@ -156,6 +356,9 @@ class TextFilter(FilterRule):
 class DateFilter(FilterRule):
     """Date range filter."""
     
+    __slots__ = ("start_date", "end_date", "_start_ns", "_end_ns")
+    
+    TAG = "DATE"
     COLOR = QColor(240, 230, 255)
     
     def __init__(self, column: str, start_date: Optional[datetime.date] = None,
@@ -164,6 +367,17 @@ class DateFilter(FilterRule):
         self.start_date = start_date
         self.end_date = end_date
     
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Inclusive lower / exclusive upper bounds as epoch nanoseconds, so
+        # vector_mask compares plain int64 values instead of Timestamps.
+        if name == "start_date":
+            self._start_ns = _date_to_ns(value) if value else None
+        elif name == "end_date":
+            self._end_ns = (
+                min(_date_to_ns(value) + _NS_PER_DAY, np.iinfo(np.int64).max) if value else None
+            )
+    
     def matches(self, value: Any) -> bool:
         try:
             if isinstance(value, (pd.Timestamp, datetime.datetime)):
@@ -174,6 +388,8 @@ class DateFilter(FilterRule):
                 date_val = pd.to_datetime(value).date()
         except Exception:
             return False
+        if _is_missing(date_val):
+            return False
         
         if self.start_date and date_val < self.start_date:
             return False
@@ -181,10 +397,52 @@ class DateFilter(FilterRule):
             return False
         return True
     
+    @staticmethod
+    def _parse_text_dates(series: pd.Series) -> Optional[pd.Series]:
+        """Parse a text column in one pass the way matches() parses each value.
+
+        Returns None when the column is not purely text or does not parse to a
+        single datetime64 dtype (e.g. mixed UTC offsets).
+        """
+        if series.dtype == object:
+            if pd.api.types.infer_dtype(series, skipna=True) != "string":
+                return None
+        elif not isinstance(series.dtype, pd.StringDtype):
+            return None
+        try:
+            # "mixed" infers the format per element, like scalar to_datetime().
+            parsed = pd.to_datetime(series, errors="coerce", format="mixed")
+        except (ValueError, TypeError, OverflowError):
+            return None
+        if not pd.api.types.is_datetime64_any_dtype(parsed.dtype):
+            return None
+        return parsed
+    
+    def vector_mask(self, series: pd.Series) -> np.ndarray:
+        if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+            parsed = self._parse_text_dates(series)
+            if parsed is None:
+                # Mixed objects (date instances, numbers...) keep the lenient
+                # per-value semantics of matches().
+                return super().vector_mask(series)
+            series = parsed
+        if getattr(series.dt, "tz", None) is not None:
+            series = series.dt.tz_localize(None)
+        # NaT is stored as the int64 minimum, so bounds alone never match it;
+        # the explicit check only matters when there is no start date.
+        values = series.to_numpy(dtype="datetime64[ns]").view("i8")
+        if self._start_ns is not None:
+            mask = values >= self._start_ns
+        else:
+            mask = values != np.iinfo(np.int64).min
+        if self._end_ns is not None:
+            np.logical_and(mask, values < self._end_ns, out=mask)
+        return mask
+    
     def get_color(self) -> QColor:
         return self.COLOR
     
-    def to_dict(self) -> dict:
+    def _build_dict(self) -> dict:
         return {
             "type": "date",
             "column": self.column,
@@ -198,7 +456,7 @@ class DateFilter(FilterRule):
         end = datetime.date.fromisoformat(data["end_date"]) if data.get("end_date") else None
         return DateFilter(data["column"], start, end)
     
-    def __str__(self):
+    def _build_str(self) -> str:
         if self.start_date and self.end_date:
             return f"{self.column}: {self.start_date} to {self.end_date}"
         elif self.start_date:
@@ -221,23 +479,44 @@ class DateFilter(FilterRule):
 class FilterManager:
     """Manages all active filters with OBSERVER PATTERN."""
     
+    # Per-column bound on memoized cell colours; high-cardinality columns would
+    # otherwise grow the cache with every distinct value scrolled past.
+    COLOR_CACHE_LIMIT = 65536
+    
     def __init__(self):
         self.filters: Dict[str, List[FilterRule]] = {}
-        self.observers: List[Callable] = []
+        # Insertion-ordered set of callbacks (dict keys give O(1) membership).
+        self.observers: Dict[Callable, None] = {}
+        # (data version, AND-combined mask) from the last compute_mask() call.
+        self._mask_cache: Optional[Tuple[int, np.ndarray]] = None
+        # column -> memoized value-to-colour callable for get_color_for_cell(),
+        # rebuilt lazily after the filters change.
+        self._color_evaluators: Optional[Dict[str, Callable[[Any], Optional[QColor]]]] = None
+        self._plan_cache: Optional[tuple] = None
+        # Column positions for matches_all_by_arrays(); see bind_columns().
+        self._bound_columns: tuple = ()
+        self._positional_plan: Optional[tuple] = None
+        self._positional_stale = True
     
     def add_observer(self, callback: Callable):
         """Register observer for filter changes."""
-        if callback not in self.observers:
-            self.observers.append(callback)
+        self.observers.setdefault(callback, None)
     
     def remove_observer(self, callback: Callable):
         """Unregister observer."""
-        if callback in self.observers:
-            self.observers.remove(callback)
+        self.observers.pop(callback, None)
     
     def notify_observers(self, event: str, data: dict):
         """Notify all observers of filter changes."""
-        for observer in self.observers:
+        # Every filter mutation funnels through here, so drop the cached mask.
+        self._mask_cache = None
+        self._color_evaluators = None
+        self._plan_cache = None
+        self._positional_stale = True
+        if not self.observers:
+            return
+        # Snapshot so observers may (un)register while being notified.
+        for observer in tuple(self.observers):
             try:
                 observer(event, data)
             except Exception as e:
@@ -269,6 +548,16 @@ class FilterManager:
             del self.filters[column]
             self.notify_observers('column_filters_cleared', {'column': column})
     
+    def set_filters(self, filter_rules):
+        """Replace all filters at once and notify observers a single time."""
+        filters: Dict[str, List[FilterRule]] = {}
+        for filter_rule in filter_rules:
+            column_filters = filters.setdefault(filter_rule.column, [])
+            if filter_rule not in column_filters:
+                column_filters.append(filter_rule)
+        self.filters = filters
+        self.notify_observers('filters_replaced', {'count': sum(len(f) for f in filters.values())})
+    
     def clear_all(self):
         """Remove all filters and notify observers."""
         self.filters.clear()
@@ -289,46 +578,183 @@ class FilterManager:
         """Check if any filters are active."""
         return len(self.filters) > 0
     
+    def _predicate_plan(self) -> Tuple[Tuple[str, Tuple[Callable[[Any], bool], ...]], ...]:
+        """(column, bound matches() methods) pairs, rebuilt after filter changes."""
+        plan = self._plan_cache
+        if plan is None:
+            plan = self._plan_cache = tuple(
+                (column, tuple(f.matches for f in filters))
+                for column, filters in self.filters.items()
+            )
+        return plan
+
+    def bind_columns(self, columns) -> None:
+        """Record the model's column order for matches_all_by_arrays()."""
+        self._bound_columns = tuple(columns)
+        self._positional_stale = True
+
+    def _build_positional_plan(self) -> Optional[tuple]:
+        positions = {name: i for i, name in enumerate(self._bound_columns)}
+        entries = []
+        for column, checks in self._predicate_plan():
+            position = positions.get(column)
+            if position is None:
+                return None  # A filter on a missing column never matches.
+            entries.append((position, checks))
+        return tuple(entries)
+
+    def matches_all_by_arrays(self, col_arrays: list, row: int) -> bool:
+        """matches_all_filters for one row of per-column arrays (see bind_columns)."""
+        if self._positional_stale:
+            self._positional_plan = self._build_positional_plan()
+            self._positional_stale = False
+        plan = self._positional_plan
+        if plan is None:
+            return False
+        for position, checks in plan:
+            value = col_arrays[position][row]
+            for matches in checks:
+                if not matches(value):
+                    return False
+        return True
+
     def matches_any_filter(self, row_data: pd.Series) -> bool:
         """Check if a row matches any filter."""
-        for column, filters in self.filters.items():
-            if column not in row_data.index:
+        index = row_data.index
+        for column, checks in self._predicate_plan():
+            if column not in index:
                 continue
             value = row_data[column]
-            for filter_rule in filters:
-                if filter_rule.matches(value):
+            for matches in checks:
+                if matches(value):
                     return True
         return False
 
     def matches_all_filters(self, row_data: pd.Series) -> bool:
         """Check if a row matches all active filters (AND logic)."""
-        if not self.filters:
-            return True
-
-        for column, filters in self.filters.items():
-            if column not in row_data.index:
+        index = row_data.index
+        for column, checks in self._predicate_plan():
+            if column not in index:
                 return False
             value = row_data[column]
-            for filter_rule in filters:
-                if not filter_rule.matches(value):
+            for matches in checks:
+                if not matches(value):
                     return False
         return True
     
+    def compute_mask(self, df: pd.DataFrame, version: Optional[int] = None) -> np.ndarray:
+        """Vectorized matches_all_filters over every row of ``df``.
+
+        The result is cached until the filters change or ``version`` differs;
+        it is shared (and patched by patch_cached_row), so treat it as read-only.
+        """
+        cached = self._mask_cache
+        if version is not None and cached is not None and cached[0] == version \
+                and len(cached[1]) == len(df):
+            return cached[1]
+
+        mask = np.ones(len(df), dtype=bool)
+        for column, filters in self.filters.items():
+            if column not in df.columns:
+                mask[:] = False
+                break
+            series = df[column]
+            if pd.api.types.is_numeric_dtype(series.dtype):
+                fused = [
+                    f for f in filters
+                    if isinstance(f, NumericFilter) and f.operator in OP_CODES
+                    and isinstance(f._threshold, float)
+                ]
+                if fused:
+                    # All numeric thresholds on the column in one pass.
+                    mask &= numeric_and(
+                        series.to_numpy(dtype=float, na_value=np.nan),
+                        np.array([OP_CODES[f.operator] for f in fused], dtype=np.int8),
+                        np.array([f._threshold for f in fused], dtype=np.float64),
+                    )
+                    if not isinstance(series.dtype, np.dtype):
+                        # pd.NA in nullable dtypes fails every rule, "!=" too.
+                        mask &= series.notna().to_numpy(dtype=bool)
+                    filters = [f for f in filters if f not in fused]
+            for filter_rule in filters:
+                if not mask.any():
+                    break
+                mask &= filter_rule.vector_mask(series)
+            if not mask.any():
+                break
+
+        if version is not None:
+            self._mask_cache = (version, mask)
+        return mask
+
+    def patch_cached_row(self, version: int, new_version: int, row: int, matched: bool):
+        """Carry the cached mask across an edit that only changed ``row``."""
+        cached = self._mask_cache
+        if cached is None or cached[0] != version or not 0 <= row < len(cached[1]):
+            return
+        cached[1][row] = matched
+        self._mask_cache = (new_version, cached[1])
+
     def get_color_for_cell(self, column: str, value: Any) -> Optional[QColor]:
         """Get highlight color for a cell if it matches any filter."""
-        if column not in self.filters:
-            return None
-        
-        for filter_rule in self.filters[column]:
-            if filter_rule.matches(value):
-                return filter_rule.get_color()
-        return None
+        evaluators = self._color_evaluators
+        if evaluators is None:
+            evaluators = self._color_evaluators = {
+                col: self._build_color_evaluator(filters) for col, filters in self.filters.items()
+            }
+        evaluate = evaluators.get(column)
+        return evaluate(value) if evaluate is not None else None
+
+    def _build_color_evaluator(self, filters: List[FilterRule]) -> Callable[[Any], Optional[QColor]]:
+        """Bake a column's filter chain into one memoized value -> colour callable."""
+        checks = tuple((f.matches, f.get_color()) for f in filters)
+        cache: Dict[tuple, Optional[QColor]] = {}
+        limit = self.COLOR_CACHE_LIMIT
+
+        def evaluate(value: Any) -> Optional[QColor]:
+            # The type is part of the key: 1, 1.0 and True hash alike but
+            # render differently for text filters. Missing values (NaN keys
+            # never compare equal) all behave alike within a type.
+            key = (type(value), None) if _is_missing(value) else (type(value), value)
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            except TypeError:
+                key = None  # Unhashable value; evaluate without caching.
+            color = None
+            for matches, filter_color in checks:
+                if matches(value):
+                    color = filter_color
+                    break
+            if key is not None:
+                if len(cache) >= limit:
+                    cache.clear()
+                cache[key] = color
+            return color
+
+        return evaluate
 
 
 class DataFrameModel(QAbstractTableModel):
     """Qt model for pandas DataFrame with REACTIVE OBSERVER PATTERN."""
     
     DATE_COL_NAME = "Date Added"
+    # Text columns with fewer distinct values than this share of rows are
+    # stored as categoricals by set_dataframe().
+    CATEGORY_RATIO = 0.5
+    
+    # Shared role colours; data() runs per cell, so avoid building new ones.
+    BG_EVEN = QColor(255, 255, 255)
+    BG_ODD = QColor(248, 248, 248)
+    FG_DEFAULT = QColor(0, 0, 0)
+    FG_HIGHLIGHT = QColor(204, 0, 0)
+    HEADER_BG = QColor(248, 248, 248)
+    HEADER_FILTERED_BG = QColor(204, 229, 255)
+    # Column-name fragments marking the person columns recoloured on highlight.
+    NAME_INDICATORS = ("name", "student", "applicant")
+    # set_highlight_mask() emits per changed run up to this many runs.
+    MAX_HIGHLIGHT_RUNS = 32
     
     dataLoaded = pyqtSignal(dict)
     dataChanged = pyqtSignal(QModelIndex, QModelIndex, list)
@@ -339,29 +765,53 @@ class DataFrameModel(QAbstractTableModel):
         self._df = df if df is not None else pd.DataFrame()
         self.filter_manager = FilterManager()
         self._highlight_mask: Optional[np.ndarray] = None
-        self.observers: List[Callable] = []
+        self._data_version = 0
+        # Original dtypes of the columns stored as categoricals, restored by
+        # dataframe() so callers see the frame they loaded.
+        self._categorized_dtypes: Dict[Any, Any] = {}
+        # (column names as str, frozenset of names); dtype categories are
+        # derived separately and only when a caller asks for them.
+        self._schema_cache: Optional[Tuple[List[str], frozenset]] = None
+        self._column_types_cache: Optional[Dict[str, str]] = None
+        # headerData() labels and filtered column positions; reset when the
+        # filters or the columns change.
+        self._header_cache: Optional[Tuple[List[str], frozenset]] = None
+        # Column labels and per-column value arrays read by data(); rebuilt
+        # lazily after the frame is replaced or reordered.
+        self._columns_tuple: Optional[tuple] = None
+        self._col_arrays: Optional[list] = None
+        # Positions of columns whose text turns red on highlighted rows.
+        self._name_like_cols: frozenset = frozenset()
+        # Per-column edit coercers for setData() and DisplayRole formatters,
+        # chosen once from the dtype.
+        self._coercers: List[Callable[[Any], Any]] = []
+        self._formatters: List[Callable[[Any], str]] = []
+        self.observers: Dict[Callable, None] = {}
         
         self.filter_manager.add_observer(self._on_filter_manager_change)
     
     def _on_filter_manager_change(self, event: str, data: dict):
         """React to filter manager changes."""
-        self.filterChanged.emit()
+        self._header_cache = None
+        # Custom signals with no connected slots are skipped.
+        if self.receivers(self.filterChanged):
+            self.filterChanged.emit()
         self.notify_observers(event, data)
         self.layoutChanged.emit()
     
     def add_observer(self, callback: Callable):
         """Register observer for data changes."""
-        if callback not in self.observers:
-            self.observers.append(callback)
+        self.observers.setdefault(callback, None)
     
     def remove_observer(self, callback: Callable):
         """Unregister observer."""
-        if callback in self.observers:
-            self.observers.remove(callback)
+        self.observers.pop(callback, None)
     
     def notify_observers(self, event: str, data: dict):
         """Notify all observers of data changes."""
-        for observer in self.observers:
+        if not self.observers:
+            return
+        for observer in tuple(self.observers):
             try:
                 observer(event, data)
             except Exception as e:
@@ -384,23 +834,15 @@ class DataFrameModel(QAbstractTableModel):
         row = index.row()
         col = index.column()
         
-        if row < 0 or row >= len(self._df) or col < 0 or col >= len(self._df.columns):
+        arrays = self._col_arrays if self._col_arrays is not None else self._column_arrays()
+        if row < 0 or row >= len(self._df) or col < 0 or col >= len(arrays):
             return QVariant()
         
-        col_name = self._df.columns[col]
-        value = self._df.iat[row, col]
-        
-        is_row_highlighted = self.is_row_highlighted(row)
+        col_name = self._columns_tuple[col]
+        value = arrays[col][row]
         
         if role == Qt.DisplayRole:
-            if pd.isna(value):
-                return ""
-            elif isinstance(value, float):
-                return f"{value:.4g}"
-            elif isinstance(value, (pd.Timestamp, datetime.datetime, datetime.date)):
-                return str(value)
-            else:
-                return str(value)
+            return self._formatters[col](value)
         
         elif role == Qt.BackgroundRole:
             color = self.filter_manager.get_color_for_cell(col_name, value)
@@ -408,14 +850,13 @@ class DataFrameModel(QAbstractTableModel):
                 return color
             
             if row % 2 == 0:
-                return QColor(255, 255, 255)
-            return QColor(248, 248, 248)
+                return self.BG_EVEN
+            return self.BG_ODD
         
         elif role == Qt.ForegroundRole:
-            col_name_lower = col_name.lower()
-            if is_row_highlighted and any(name_indicator in col_name_lower for name_indicator in ['name', 'student', 'applicant']):
-                return QColor(204, 0, 0)
-            return QColor(0, 0, 0)
+            if col in self._name_like_cols and self.is_row_highlighted(row):
+                return self.FG_HIGHLIGHT
+            return self.FG_DEFAULT
         
         elif role == Qt.TextAlignmentRole:
             if isinstance(value, (int, float)) and not pd.isna(value):
@@ -427,24 +868,20 @@ class DataFrameModel(QAbstractTableModel):
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if role == Qt.DisplayRole:
             if orientation == Qt.Horizontal:
-                if 0 <= section < len(self._df.columns):
-                    col_name = str(self._df.columns[section])
-                    if self.filter_manager.get_filters_for_column(col_name):
-                        return f"[F] {col_name}"
-                    return col_name
+                labels, _ = self._header_state()
+                if 0 <= section < len(labels):
+                    return labels[section]
                 return ""
             else:
                 return str(section + 1)
         
         elif role == Qt.BackgroundRole and orientation == Qt.Horizontal:
-            if 0 <= section < len(self._df.columns):
-                col_name = str(self._df.columns[section])
-                if self.filter_manager.get_filters_for_column(col_name):
-                    return QColor(204, 229, 255)
-            return QColor(248, 248, 248)
+            if section in self._header_state()[1]:
+                return self.HEADER_FILTERED_BG
+            return self.HEADER_BG
         
         elif role == Qt.ForegroundRole:
-            return QColor(0, 0, 0)
+            return self.FG_DEFAULT
         
         elif role == Qt.FontRole and orientation == Qt.Horizontal:
             font = QFont()
@@ -453,6 +890,21 @@ class DataFrameModel(QAbstractTableModel):
         
         return QVariant()
     
+    def _header_state(self) -> Tuple[List[str], frozenset]:
+        """Header labels ("[F] " marks filtered columns) and filtered positions."""
+        if self._header_cache is None:
+            filtered = self.filter_manager.filters
+            labels = []
+            positions = set()
+            for i, name in enumerate(self.column_names_str()):
+                if filtered.get(name):
+                    labels.append(f"[F] {name}")
+                    positions.add(i)
+                else:
+                    labels.append(name)
+            self._header_cache = (labels, frozenset(positions))
+        return self._header_cache
+
     def flags(self, index):
         if not index.isValid():
             return Qt.NoItemFlags
@@ -477,22 +929,42 @@ class DataFrameModel(QAbstractTableModel):
         if value is None or (isinstance(value, str) and value.strip() == ""):
             new_value = np.nan
         else:
-            new_value = value
-
+            if self._col_arrays is None:
+                self._column_arrays()
             try:
-                if pd.api.types.is_numeric_dtype(dtype):
-                    new_value = pd.to_numeric(value, errors="coerce")
-                elif pd.api.types.is_datetime64_any_dtype(dtype):
-                    new_value = pd.to_datetime(value, errors="coerce")
-                else:
-                    new_value = str(value)
+                new_value = self._coercers[col](value)
             except Exception:
                 # Fall back to raw input if coercion fails
                 new_value = value
 
+        if isinstance(dtype, pd.CategoricalDtype) and not _is_missing(new_value) \
+                and new_value not in dtype.categories:
+            # Keep categories sorted so sort() still orders the column lexically.
+            categories = dtype.categories.append(pd.Index([new_value])).sort_values()
+            self._df[col_name] = self._df[col_name].cat.set_categories(categories)
+
         self._df.iat[row, col] = new_value
+        self._data_version += 1
+        if self._col_arrays is not None:
+            # The write may have replaced the column's storage (copy-on-write,
+            # upcast or new categories), so re-read just this column.
+            self._col_arrays[col] = self._column_values(self._df.iloc[:, col])
+        if self.filter_manager.has_filters():
+            # Only this row can have changed, so re-check it alone rather than
+            # letting the version bump rebuild the whole filter mask.
+            self.filter_manager.patch_cached_row(
+                self._data_version - 1, self._data_version, row, self._row_matches_filters(row)
+            )
+        new_dtype = self._df[col_name].dtype
+        if new_dtype != dtype:
+            # The edit upcast the column (e.g. int -> float/object).
+            self._column_types_cache = None
+            if self._col_arrays is not None:
+                self._coercers[col] = self._coercer_for(new_dtype)
+                self._formatters[col] = self._formatter_for(new_dtype)
 
-        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.BackgroundRole, Qt.ForegroundRole])
+        if self.receivers(self.dataChanged):
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.BackgroundRole, Qt.ForegroundRole])
         self.notify_observers("cell_updated", {"row": row, "column": col_name, "value": new_value})
 
         return True
@@ -502,14 +974,17 @@ class DataFrameModel(QAbstractTableModel):
             return
         
         self.layoutAboutToBeChanged.emit()
-        col_name = self._df.columns[column]
-        self._df.sort_values(
-            by=col_name,
+        # Argsort just the key column, then reorder every column in one take.
+        # The array's own argsort handles categoricals (by code), datetimes and
+        # nullable dtypes, keeping missing values last.
+        order_index = self._df.iloc[:, column].array.argsort(
             ascending=(order == Qt.AscendingOrder),
-            inplace=True,
-            na_position='last'
+            kind="stable",
+            na_position="last",
         )
-        self._df.reset_index(drop=True, inplace=True)
+        self._df = self._df.take(order_index).reset_index(drop=True)
+        self._data_version += 1
+        self._col_arrays = None
         self.layoutChanged.emit()
     
     def is_row_highlighted(self, row: int) -> bool:
@@ -521,13 +996,19 @@ class DataFrameModel(QAbstractTableModel):
         try:
             if self._highlight_mask is not None and row < len(self._highlight_mask):
                 return bool(self._highlight_mask[row])
-            row_data = self._df.iloc[row]
-            return self.filter_manager.matches_all_filters(row_data)
+            mask = self.filter_manager.compute_mask(self._df, self._data_version)
+            return bool(mask[row])
         except Exception:
             return False
 
+    def _row_matches_filters(self, row: int) -> bool:
+        """Scalar matches_all_filters for one row, read from the column arrays."""
+        arrays = self._col_arrays if self._col_arrays is not None else self._column_arrays()
+        return self.filter_manager.matches_all_by_arrays(arrays, row)
+
     def set_highlight_mask(self, mask: Optional[np.ndarray]):
         """Set per-row highlight mask for custom highlighting."""
+        previous = self._highlight_mask
         if mask is None:
             self._highlight_mask = None
         else:
@@ -536,18 +1017,78 @@ class DataFrameModel(QAbstractTableModel):
             except Exception:
                 self._highlight_mask = None
 
-        if not self._df.empty:
-            top_left = self.index(0, 0)
-            bottom_right = self.index(
-                self.rowCount() - 1,
-                self.columnCount() - 1
-            )
-            self.dataChanged.emit(top_left, bottom_right, [Qt.BackgroundRole, Qt.ForegroundRole])
+        if self._df.empty or not self.receivers(self.dataChanged):
+            return
+
+        runs = [(0, self.rowCount() - 1)]
+        current = self._highlight_mask
+        if previous is not None and current is not None and len(previous) == len(current):
+            # Only repaint the rows whose highlight actually flipped, one
+            # signal per contiguous run.
+            changed = np.flatnonzero(previous != current)
+            if changed.size == 0:
+                return
+            breaks = np.flatnonzero(np.diff(changed) != 1)
+            if breaks.size < self.MAX_HIGHLIGHT_RUNS:
+                starts = np.concatenate(([changed[0]], changed[breaks + 1]))
+                ends = np.concatenate((changed[breaks], [changed[-1]]))
+                runs = zip(starts.tolist(), ends.tolist())
+            else:
+                # Scattered flips: one bounding span beats many tiny signals.
+                runs = [(int(changed[0]), int(changed[-1]))]
+
+        last_col = self.columnCount() - 1
+        roles = [Qt.BackgroundRole, Qt.ForegroundRole]
+        for first_row, last_row in runs:
+            self.dataChanged.emit(self.index(first_row, 0), self.index(last_row, last_col), roles)
+
+    @staticmethod
+    def _coercer_for(dtype) -> Callable[[Any], Any]:
+        if pd.api.types.is_numeric_dtype(dtype):
+            return _coerce_number
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return _coerce_timestamp
+        return str
+
+    @staticmethod
+    def _formatter_for(dtype) -> Callable[[Any], str]:
+        if isinstance(dtype, np.dtype):
+            if dtype == np.float64:
+                return _format_float
+            if dtype.kind in "iub":
+                return str
+            if dtype.kind in "mM":
+                return _format_timestamp
+        return _format_value
+
+    @staticmethod
+    def _column_values(series: pd.Series):
+        """Positional value store whose scalars match what ``iat`` returns."""
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind not in "mM":
+            return series.to_numpy()
+        # Extension and datetime arrays box to pd.NA / Timestamp like iat does.
+        return series.array
+
+    def _column_arrays(self) -> list:
+        self._columns_tuple = tuple(self._df.columns)
+        self._name_like_cols = frozenset(
+            i for i, name in enumerate(self._columns_tuple)
+            if any(indicator in str(name).lower() for indicator in self.NAME_INDICATORS)
+        )
+        self.filter_manager.bind_columns(self._columns_tuple)
+        self._coercers = [self._coercer_for(dtype) for dtype in self._df.dtypes]
+        self._formatters = [self._formatter_for(dtype) for dtype in self._df.dtypes]
+        self._col_arrays = [
+            self._column_values(self._df.iloc[:, i]) for i in range(len(self._columns_tuple))
+        ]
+        return self._col_arrays
 
     def get_raw_value(self, row: int, col: int):
         """Get raw dataframe value for a given row/column index."""
+        arrays = self._col_arrays if self._col_arrays is not None else self._column_arrays()
         try:
-            return self._df.iat[row, col]
+            return arrays[col][row]
         except Exception:
             return None
     
@@ -555,6 +1096,13 @@ class DataFrameModel(QAbstractTableModel):
         """Replace the entire DataFrame and notify observers."""
         self.beginResetModel()
         self._df = df.copy()
+        self._categorized_dtypes = self._categorize_text_columns(self._df)
+        self._data_version += 1
+        self._schema_cache = None
+        self._header_cache = None
+        self._column_types_cache = None
+        self._columns_tuple = None
+        self._col_arrays = None
         self.filter_manager.clear_all()
         self._highlight_mask = None
         self.endResetModel()
@@ -568,17 +1116,84 @@ class DataFrameModel(QAbstractTableModel):
             'columns': list(df.columns)
         })
     
+    @classmethod
+    def _categorize_text_columns(cls, df: pd.DataFrame) -> Dict[Any, Any]:
+        """Store repetitive text columns as categoricals (in place).
+
+        Codes plus one copy of each distinct string are far smaller than a
+        string per cell, and filters only need to scan the categories.
+        Returns the original dtype of every converted column.
+        """
+        converted: Dict[Any, Any] = {}
+        if df.empty:
+            return converted
+        limit = len(df) * cls.CATEGORY_RATIO
+        for col in df.columns:
+            series = df[col]
+            if isinstance(series, pd.DataFrame):
+                continue  # Duplicate column labels.
+            if series.dtype == object:
+                if pd.api.types.infer_dtype(series, skipna=True) != "string":
+                    continue
+            elif not isinstance(series.dtype, pd.StringDtype):
+                continue
+            if series.nunique(dropna=True) < limit:
+                converted[col] = series.dtype
+                df[col] = series.astype("category")
+        return converted
+
     def dataframe(self) -> pd.DataFrame:
-        """Get the underlying DataFrame."""
-        return self._df.copy()
+        """Get the underlying DataFrame.
+
+        Under Copy-on-Write this is a lazy copy that shares memory with the
+        model until either side writes; otherwise it is a deep copy. Columns
+        the model keeps as categoricals come back in their original dtype.
+        """
+        df = self._df.copy(deep=not _copy_on_write_enabled())
+        for col, dtype in self._categorized_dtypes.items():
+            df[col] = df[col].astype(dtype)
+        return df
+
+    def data_version(self) -> int:
+        """Counter bumped whenever the underlying rows or values change."""
+        return self._data_version
     
-    def get_column_dtype(self, column: str) -> str:
-        """Get the data type category of a column."""
-        if column not in self._df.columns:
-            return "unknown"
-        
-        dtype = self._df[column].dtype
-        
+    def cached_schema(self) -> Tuple[List[str], Dict[str, str]]:
+        """Column names (as str) and their dtype categories.
+
+        Rebuilt only after a schema change; callers must not mutate the result.
+        """
+        columns, _ = self._schema()
+        if self._column_types_cache is None:
+            self._column_types_cache = {
+                name: self._dtype_category(dtype)
+                for name, dtype in zip(columns, self._df.dtypes)
+            }
+        return columns, self._column_types_cache
+    
+    def column_names_str(self) -> List[str]:
+        """Column names as str, cached until the schema changes."""
+        return self._schema()[0]
+    
+    def column_name_set(self) -> frozenset:
+        """Column names (as str) for O(1) membership checks."""
+        return self._schema()[1]
+    
+    def _schema(self):
+        if self._schema_cache is None:
+            labels = self._df.columns
+            if labels.inferred_type == "string":
+                # Loaded files already have str headers; tolist() is one C pass.
+                columns = labels.tolist()
+            else:
+                # str() per label keeps e.g. datetime headers as str(Timestamp),
+                # which Index.astype(str) would format differently.
+                columns = [str(c) for c in labels]
+            self._schema_cache = (columns, frozenset(columns))
+        return self._schema_cache
+    
+    @staticmethod
+    def _dtype_category(dtype) -> str:
         if pd.api.types.is_numeric_dtype(dtype):
             return "numeric"
         elif pd.api.types.is_datetime64_any_dtype(dtype):
@@ -586,6 +1201,12 @@ class DataFrameModel(QAbstractTableModel):
         else:
             return "text"
     
+    def get_column_dtype(self, column: str) -> str:
+        """Get the data type category of a column."""
+        if column not in self._df.columns:
+            return "unknown"
+        return self._dtype_category(self._df[column].dtype)
+    
     def get_column_stats(self, column: str) -> dict:
         """Get statistics for a column."""
         if column not in self._df.columns:
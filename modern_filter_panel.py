@@ -2,10 +2,11 @@
 Modern filter panel components.
 """
 
-import os
-from typing import List
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, List
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QEvent, QTimer, pyqtSignal
 from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import (
     QComboBox,
@@ -20,16 +21,15 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from models import DateFilter, FilterRule, NumericFilter, TextFilter
+from models import FilterRule
 from styles import AppTheme
 
 
+@lru_cache(maxsize=1)
 def _load_panel_logo() -> QPixmap:
-    """Load the square app logo for the filter panel header."""
+    """Load the square app logo for the filter panel header (once per process)."""
     path = AppTheme.asset_path("logo.png")
-    if not os.path.exists(path):
-        return QPixmap()
-
+    # QPixmap reports a missing file as a null pixmap; no separate stat needed.
     pixmap = QPixmap(path)
     if pixmap.isNull():
         return QPixmap()
@@ -37,188 +37,319 @@ def _load_panel_logo() -> QPixmap:
     return pixmap.scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
 
+# One stylesheet for the whole panel, chips included. Widgets are matched by
+# object name, and chip hover is a dynamic property, so nothing below calls
+# setStyleSheet per widget and Qt parses a single sheet.
+_PANEL_QSS = f"""
+ModernFilterPanel {{
+    background-color: {AppTheme.BACKGROUND};
+    border-right: 1px solid {AppTheme.GRAY_200};
+}}
+#FilterPanelHeader {{
+    background-color: {AppTheme.BACKGROUND};
+    border-left: 4px solid {AppTheme.PRIMARY};
+    border-bottom: 1px solid {AppTheme.GRAY_200};
+}}
+QLabel#FilterPanelLogo {{
+    font-size: 12pt;
+    color: {AppTheme.PRIMARY};
+    font-weight: 800;
+}}
+QLabel#FilterPanelTitle {{
+    color: {AppTheme.TEXT};
+    font-size: 11.5pt;
+    font-weight: 600;
+    font-family: {AppTheme.FONT_UI_BOLD};
+}}
+QLabel#FilterPanelSubtitle {{
+    color: {AppTheme.TEXT_SECONDARY};
+    font-size: 8.5pt;
+    font-weight: 400;
+}}
+QToolButton#FilterPanelCollapse {{
+    border: 1px solid {AppTheme.BORDER};
+    background-color: {AppTheme.BACKGROUND};
+    color: {AppTheme.TEXT};
+    border-radius: 4px;
+    font-weight: 700;
+    font-size: 10pt;
+}}
+QToolButton#FilterPanelCollapse:hover {{
+    background-color: {AppTheme.PRIMARY};
+    color: #FFFFFF;
+    border-color: {AppTheme.PRIMARY};
+}}
+QFrame#FilterControlBar {{
+    background-color: {AppTheme.BACKGROUND};
+    border-bottom: 1px solid {AppTheme.GRAY_200};
+}}
+QPushButton#AddRuleBtn {{
+    background-color: {AppTheme.PRIMARY};
+    color: #FFFFFF;
+    border: none;
+    border-radius: 8px;
+    padding: 10px 14px;
+    font-weight: 600;
+    font-family: {AppTheme.FONT_UI_BOLD};
+    font-size: 9.5pt;
+}}
+QPushButton#AddRuleBtn:hover {{
+    background-color: {AppTheme.PRIMARY_DARK};
+}}
+QPushButton#AddRuleBtn:pressed {{
+    background-color: {AppTheme.PRIMARY_HOVER};
+}}
+QPushButton#ClearBtn {{
+    background-color: transparent;
+    color: {AppTheme.ERROR};
+    border: 1px solid {AppTheme.ERROR};
+    border-radius: 8px;
+    padding: 8px;
+    font-weight: 500;
+    font-size: 9pt;
+}}
+QPushButton#ClearBtn:hover {{
+    background-color: {AppTheme.ERROR};
+    color: #FFFFFF;
+}}
+QFrame#FilterModeBar {{
+    background-color: {AppTheme.SURFACE};
+    border: 1px solid {AppTheme.GRAY_200};
+    border-radius: 6px;
+}}
+QLabel#FilterModeLabel {{
+    color: {AppTheme.TEXT_SECONDARY};
+    font-size: 8.5pt;
+    font-weight: 500;
+    background: transparent;
+    border: none;
+}}
+QFrame#FilterModeSegment {{
+    background-color: {AppTheme.GRAY_100};
+    border: 1px solid {AppTheme.GRAY_200};
+    border-radius: 6px;
+}}
+QPushButton#ModeSegmentBtn {{
+    background-color: transparent;
+    color: {AppTheme.TEXT_SECONDARY};
+    border: none;
+    border-radius: 4px;
+    padding: 4px 12px;
+    font-size: 8pt;
+    font-weight: 600;
+    min-width: 40px;
+}}
+QPushButton#ModeSegmentBtn:hover {{
+    background-color: {AppTheme.GRAY_200};
+    color: {AppTheme.TEXT};
+}}
+QPushButton#ModeSegmentBtn:checked {{
+    background-color: {AppTheme.PRIMARY};
+    color: #FFFFFF;
+}}
+QPushButton#ModeSegmentBtn:checked:hover {{
+    background-color: {AppTheme.PRIMARY_DARK};
+}}
+QScrollArea#FilterScrollArea {{
+    background-color: {AppTheme.BACKGROUND};
+    border: none;
+}}
+QLabel#FilterEmptyLabel {{
+    color: {AppTheme.TEXT_SECONDARY};
+    font-size: 10pt;
+    font-weight: 400;
+    padding: 36px 16px;
+}}
+QLabel#FilterStatsLabel {{
+    background-color: {AppTheme.BACKGROUND};
+    color: {AppTheme.TEXT_SECONDARY};
+    font-size: 9pt;
+    font-weight: 400;
+    padding: 9px;
+    border-top: 1px solid {AppTheme.GRAY_200};
+}}
+ModernFilterChip {{
+    background-color: {AppTheme.BACKGROUND};
+    border: 1px solid {AppTheme.BORDER};
+    border-radius: 8px;
+}}
+ModernFilterChip[hovered="true"] {{
+    background-color: {AppTheme.PRIMARY_LIGHT};
+    border: 1px solid {AppTheme.PRIMARY};
+}}
+QLabel#ChipTag {{
+    color: {AppTheme.PRIMARY_DARK};
+    background-color: {AppTheme.PRIMARY_LIGHT};
+    border: 1px solid {AppTheme.PRIMARY};
+    border-radius: 3px;
+    padding: 1px 5px;
+    font-size: 7.5pt;
+    font-weight: 600;
+}}
+QLabel#ChipText {{
+    color: {AppTheme.TEXT};
+    font-weight: 500;
+    font-size: 9.5pt;
+    background: transparent;
+    border: none;
+}}
+ModernFilterChip[hovered="true"] > QLabel#ChipText {{
+    color: {AppTheme.PRIMARY_DARK};
+    font-weight: 600;
+}}
+QPushButton#ChipRemoveBtn {{
+    background-color: {AppTheme.GRAY_200};
+    color: {AppTheme.TEXT_SECONDARY};
+    border: none;
+    font-size: 11pt;
+    font-weight: 600;
+    border-radius: 9px;
+    padding: 0px;
+    margin: 0px;
+}}
+QPushButton#ChipRemoveBtn:hover {{
+    background-color: {AppTheme.ERROR};
+    color: #FFFFFF;
+}}
+ModernFilterChip QMenu {{
+    background-color: {AppTheme.BACKGROUND};
+    color: {AppTheme.TEXT};
+    border: 1px solid {AppTheme.BORDER};
+    border-radius: 6px;
+    padding: 4px;
+}}
+ModernFilterChip QMenu::item {{
+    padding: 8px 18px;
+    border-radius: 4px;
+}}
+ModernFilterChip QMenu::item:selected {{
+    background-color: {AppTheme.PRIMARY};
+    color: #FFFFFF;
+}}
+"""
+
+
 class ModernFilterChip(QFrame):
     """Filter chip with hover state and actions."""
 
     removeClicked = pyqtSignal(object)
     editClicked = pyqtSignal(object)
     tabRequested = pyqtSignal(object)
+    # The chip's styling changed, so its sizeHint() may have too.
+    sizeHintChanged = pyqtSignal(object)
 
     def __init__(self, filter_rule: FilterRule, parent=None):
         super().__init__(parent)
         self.filter_rule = filter_rule
+        # Hover state the "hovered" style property currently reflects.
         self._hovered = False
+        self._menu = None
         self._setup_ui()
 
     def _setup_ui(self):
-        self.setFrameStyle(QFrame.NoFrame)
+        # QFrame already defaults to NoFrame; the chip's border comes from QSS.
         self.setCursor(Qt.PointingHandCursor)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(8, 6, 6, 6)
         layout.setSpacing(6)
 
-        tag_label = QLabel(self._get_rule_tag())
-        tag_label.setStyleSheet(
-            f"""
-            color: {AppTheme.PRIMARY_DARK};
-            background-color: {AppTheme.PRIMARY_LIGHT};
-            border: 1px solid {AppTheme.PRIMARY};
-            border-radius: 3px;
-            padding: 1px 5px;
-            font-size: 7.5pt;
-            font-weight: 600;
-            """
-        )
-        layout.addWidget(tag_label, 0, Qt.AlignVCenter)
+        self.tag_label = QLabel(type(self.filter_rule).TAG)
+        self.tag_label.setObjectName("ChipTag")
+        layout.addWidget(self.tag_label, 0, Qt.AlignVCenter)
 
         rule_text = str(self.filter_rule)
         self.text_label = QLabel(rule_text)
+        self.text_label.setObjectName("ChipText")
         self.text_label.setWordWrap(False)
         self.text_label.setToolTip(rule_text)  # Show full text on hover
-        self.text_label.setStyleSheet(
-            f"""
-            color: {AppTheme.TEXT};
-            font-weight: 500;
-            font-size: 8.5pt;
-            background: transparent;
-            border: none;
-            """
-        )
         layout.addWidget(self.text_label, 1, Qt.AlignVCenter)
 
         self.remove_btn = QPushButton("\u00d7")
+        self.remove_btn.setObjectName("ChipRemoveBtn")
         self.remove_btn.setFixedSize(18, 18)
         self.remove_btn.setCursor(Qt.PointingHandCursor)
-        self.remove_btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: {AppTheme.GRAY_200};
-                color: {AppTheme.TEXT_SECONDARY};
-                border: none;
-                font-size: 11pt;
-                font-weight: 600;
-                border-radius: 9px;
-                padding: 0px;
-                margin: 0px;
-            }}
-            QPushButton:hover {{
-                background-color: {AppTheme.ERROR};
-                color: #FFFFFF;
-            }}
-            """
-        )
-        self.remove_btn.clicked.connect(lambda: self.removeClicked.emit(self.filter_rule))
+        self.remove_btn.clicked.connect(self._emit_remove)
         layout.addWidget(self.remove_btn, 0, Qt.AlignVCenter)
 
+    def reconfigure(self, filter_rule: FilterRule):
+        """Point a pooled chip at a new rule without rebuilding its widgets."""
+        self.filter_rule = filter_rule
+        self.tag_label.setText(type(filter_rule).TAG)
+        rule_text = str(filter_rule)
+        self.text_label.setText(rule_text)
+        self.text_label.setToolTip(rule_text)
+        # A chip hidden while hovered never received its leave event.
         self._update_style(hovered=False)
 
-    def _get_rule_tag(self) -> str:
-        if isinstance(self.filter_rule, NumericFilter):
-            return "NUM"
-        if isinstance(self.filter_rule, TextFilter):
-            return "TXT"
-        if isinstance(self.filter_rule, DateFilter):
-            return "DATE"
-        return "RULE"
-
     def _update_style(self, hovered: bool):
-        if hovered:
-            self.setStyleSheet(
-                f"""
-                ModernFilterChip {{
-                    background-color: {AppTheme.PRIMARY_LIGHT};
-                    border: 1px solid {AppTheme.PRIMARY};
-                    border-radius: 8px;
-                }}
-                """
-            )
-            self.text_label.setStyleSheet(
-                f"""
-                color: {AppTheme.PRIMARY_DARK};
-                font-weight: 600;
-                font-size: 9.5pt;
-                background: transparent;
-                border: none;
-                """
-            )
-        else:
-            self.setStyleSheet(
-                f"""
-                ModernFilterChip {{
-                    background-color: {AppTheme.BACKGROUND};
-                    border: 1px solid {AppTheme.BORDER};
-                    border-radius: 8px;
-                }}
-                """
-            )
-            self.text_label.setStyleSheet(
-                f"""
-                color: {AppTheme.TEXT};
-                font-weight: 500;
-                font-size: 9.5pt;
-                background: transparent;
-                border: none;
-                """
-            )
+        if hovered == self._hovered:
+            # Duplicate enter/leave events; the property is already set.
+            return
+        self._hovered = hovered
+        self.setProperty("hovered", hovered)
+        # Property selectors are only re-evaluated on polish; the label is
+        # styled through a child selector, so it needs the same.
+        for widget in (self, self.text_label):
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
+        # The hovered label is bold, which makes it wider.
+        self.sizeHintChanged.emit(self)
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.StyleChange, QEvent.FontChange):
+            self.sizeHintChanged.emit(self)
+        super().changeEvent(event)
 
     def enterEvent(self, event):
-        self._hovered = True
         self._update_style(hovered=True)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
-        self._hovered = False
         self._update_style(hovered=False)
         super().leaveEvent(event)
 
+    # Bound-method slots rather than lambdas: no closure per connection, and
+    # the rule is read at emit time so pooled chips stay correct after
+    # reconfigure().
+    def _emit_remove(self):
+        self.removeClicked.emit(self.filter_rule)
+
+    def _emit_edit(self):
+        self.editClicked.emit(self.filter_rule)
+
+    def _emit_tab(self):
+        self.tabRequested.emit(self.filter_rule)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            self.editClicked.emit(self.filter_rule)
+            self._emit_edit()
         super().mousePressEvent(event)
 
     def contextMenuEvent(self, event):
-        menu = QMenu(self)
-        menu.setStyleSheet(
-            f"""
-            QMenu {{
-                background-color: {AppTheme.BACKGROUND};
-                color: {AppTheme.TEXT};
-                border: 1px solid {AppTheme.BORDER};
-                border-radius: 6px;
-                padding: 4px;
-            }}
-            QMenu::item {{
-                padding: 8px 18px;
-                border-radius: 4px;
-            }}
-            QMenu::item:selected {{
-                background-color: {AppTheme.PRIMARY};
-                color: #FFFFFF;
-            }}
-            """
-        )
-
-        edit_action = menu.addAction("Edit rule")
-        edit_action.triggered.connect(lambda: self.editClicked.emit(self.filter_rule))
-
-        tab_action = menu.addAction("Open preview tab")
-        tab_action.triggered.connect(lambda: self.tabRequested.emit(self.filter_rule))
-
-        menu.addSeparator()
-
-        remove_action = menu.addAction("Remove rule")
-        remove_action.triggered.connect(lambda: self.removeClicked.emit(self.filter_rule))
-
-        menu.exec_(event.globalPos())
+        if self._menu is None:
+            # Built on the first right-click and reused; the actions read
+            # self.filter_rule when triggered. Styled by the panel sheet.
+            menu = QMenu(self)
+            menu.addAction("Edit rule").triggered.connect(self._emit_edit)
+            menu.addAction("Open preview tab").triggered.connect(self._emit_tab)
+            menu.addSeparator()
+            menu.addAction("Remove rule").triggered.connect(self._emit_remove)
+            self._menu = menu
+
+        self._menu.exec_(event.globalPos())
 
 
 class ModernFilterPanel(QWidget):
     """Filter management side panel."""
 
+    # Removed chips kept hidden for reuse; more than this are deleted.
+    CHIP_POOL_LIMIT = 64
+
     filterAdded = pyqtSignal(object)
     filterRemoved = pyqtSignal(object)
-    filterEdited = pyqtSignal(object, object)
+    filterEdited = pyqtSignal(object)
     allFiltersCleared = pyqtSignal()
     filterModeChanged = pyqtSignal(str)
     ruleTabRequested = pyqtSignal(object)
@@ -228,9 +359,23 @@ class ModernFilterPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.active_filters: List[FilterRule] = []
+        # Chip for each rule object, keyed by id() since rules compare by value.
+        self._chip_by_rule: Dict[int, ModernFilterChip] = {}
+        self._chip_pool: List[ModernFilterChip] = []
+        # sizeHint() width of each chip in the layout; 0 until first measured.
+        self._chip_widths: Dict[ModernFilterChip, int] = {}
+        # Rules (a tail of active_filters) whose chips are built on first show.
+        self._pending_rules: List[FilterRule] = []
+        self._batch_depth = 0
+        # Footer/width refresh deferred until the outermost batch ends.
+        self._stats_dirty = False
+        # A queued refresh is already scheduled for the next event loop pass.
+        self._refresh_queued = False
         self._setup_ui()
 
     def _setup_ui(self):
+        self.setStyleSheet(_PANEL_QSS)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -241,24 +386,22 @@ class ModernFilterPanel(QWidget):
         header_layout.setContentsMargins(12, 12, 12, 10)
         header_layout.setSpacing(8)
 
+        # Nested layouts already default to zero margins.
         title_row = QHBoxLayout()
-        title_row.setContentsMargins(0, 0, 0, 0)
         title_row.setSpacing(8)
 
         self.logo_label = QLabel()
+        self.logo_label.setObjectName("FilterPanelLogo")
         panel_logo = _load_panel_logo()
         if not panel_logo.isNull():
             self.logo_label.setPixmap(panel_logo)
             self.logo_label.setFixedSize(panel_logo.size())
         else:
             self.logo_label.setText("F")
-            self.logo_label.setStyleSheet(f"font-size: 12pt; color: {AppTheme.PRIMARY}; font-weight: 800;")
         title_row.addWidget(self.logo_label, 0, Qt.AlignVCenter)
 
         self.title_label = QLabel("Rules")
-        self.title_label.setStyleSheet(
-            f"color: {AppTheme.TEXT}; font-size: 11.5pt; font-weight: 600; font-family: {AppTheme.FONT_UI_BOLD};"
-        )
+        self.title_label.setObjectName("FilterPanelTitle")
         title_row.addWidget(self.title_label, 1)
 
         self.collapse_btn = QToolButton()
@@ -267,23 +410,6 @@ class ModernFilterPanel(QWidget):
         self.collapse_btn.setText("<")
         self.collapse_btn.setToolTip("Collapse panel")
         self.collapse_btn.setFixedSize(24, 24)
-        self.collapse_btn.setStyleSheet(
-            f"""
-            QToolButton {{
-                border: 1px solid {AppTheme.BORDER};
-                background-color: {AppTheme.BACKGROUND};
-                color: {AppTheme.TEXT};
-                border-radius: 4px;
-                font-weight: 700;
-                font-size: 10pt;
-            }}
-            QToolButton:hover {{
-                background-color: {AppTheme.PRIMARY};
-                color: #FFFFFF;
-                border-color: {AppTheme.PRIMARY};
-            }}
-            """
-        )
         self.collapse_btn.clicked.connect(self._on_collapse_clicked)
         self.collapse_btn.setVisible(False)
         self._is_collapsed = False
@@ -292,162 +418,70 @@ class ModernFilterPanel(QWidget):
         header_layout.addLayout(title_row)
 
         self.subtitle_label = QLabel("Add a filter to create a rule tab")
-        self.subtitle_label.setStyleSheet(f"color: {AppTheme.TEXT_SECONDARY}; font-size: 8.5pt; font-weight: 400;")
+        self.subtitle_label.setObjectName("FilterPanelSubtitle")
         self.subtitle_label.setWordWrap(True)
         header_layout.addWidget(self.subtitle_label)
 
-        self.header.setStyleSheet(
-            f"""
-            #FilterPanelHeader {{
-                background-color: {AppTheme.BACKGROUND};
-                border-left: 4px solid {AppTheme.PRIMARY};
-                border-bottom: 1px solid {AppTheme.GRAY_200};
-            }}
-            """
-        )
         layout.addWidget(self.header)
 
         self.control_bar = QFrame()
+        self.control_bar.setObjectName("FilterControlBar")
         control_layout = QHBoxLayout(self.control_bar)
         control_layout.setContentsMargins(12, 10, 12, 10)
         control_layout.setSpacing(8)
 
         self.add_btn = QPushButton("Create Rule")
-        self.add_btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: {AppTheme.PRIMARY};
-                color: #FFFFFF;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 14px;
-                font-weight: 600;
-                font-family: {AppTheme.FONT_UI_BOLD};
-                font-size: 9.5pt;
-            }}
-            QPushButton:hover {{
-                background-color: {AppTheme.PRIMARY_DARK};
-            }}
-            QPushButton:pressed {{
-                background-color: {AppTheme.PRIMARY_HOVER};
-            }}
-            """
-        )
+        self.add_btn.setObjectName("AddRuleBtn")
         control_layout.addWidget(self.add_btn, 1)
 
         self.clear_btn = QPushButton("Clear")
+        self.clear_btn.setObjectName("ClearBtn")
         self.clear_btn.setFixedWidth(68)
         self.clear_btn.setToolTip("Clear all filters")
-        self.clear_btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {AppTheme.ERROR};
-                border: 1px solid {AppTheme.ERROR};
-                border-radius: 8px;
-                padding: 8px;
-                font-weight: 500;
-                font-size: 9pt;
-            }}
-            QPushButton:hover {{
-                background-color: {AppTheme.ERROR};
-                color: #FFFFFF;
-            }}
-            """
-        )
         self.clear_btn.clicked.connect(self.allFiltersCleared.emit)
         control_layout.addWidget(self.clear_btn)
 
-        self.control_bar.setStyleSheet(
-            f"""
-            QFrame {{
-                background-color: {AppTheme.BACKGROUND};
-                border-bottom: 1px solid {AppTheme.GRAY_200};
-            }}
-            """
-        )
         layout.addWidget(self.control_bar)
 
         # Mode bar wrapper for proper margins
         mode_wrapper = QWidget()
         mode_wrapper_layout = QVBoxLayout(mode_wrapper)
         mode_wrapper_layout.setContentsMargins(12, 6, 12, 6)
-        mode_wrapper_layout.setSpacing(0)
 
         self.mode_bar = QFrame()
+        self.mode_bar.setObjectName("FilterModeBar")
         mode_layout = QHBoxLayout(self.mode_bar)
         mode_layout.setContentsMargins(8, 6, 8, 6)
         mode_layout.setSpacing(6)
 
         self.mode_label = QLabel("Combine")
-        self.mode_label.setStyleSheet(
-            f"""
-            color: {AppTheme.TEXT_SECONDARY};
-            font-size: 8.5pt;
-            font-weight: 500;
-            background: transparent;
-            border: none;
-            """
-        )
+        self.mode_label.setObjectName("FilterModeLabel")
         mode_layout.addWidget(self.mode_label, 0, Qt.AlignVCenter)
 
         # Segmented control container
         self._segment_container = QFrame()
+        self._segment_container.setObjectName("FilterModeSegment")
         segment_layout = QHBoxLayout(self._segment_container)
         segment_layout.setContentsMargins(2, 2, 2, 2)
         segment_layout.setSpacing(0)
 
         self._mode_all_btn = QPushButton("ALL")
+        self._mode_all_btn.setObjectName("ModeSegmentBtn")
         self._mode_all_btn.setCheckable(True)
         self._mode_all_btn.setChecked(True)
         self._mode_all_btn.setCursor(Qt.PointingHandCursor)
         self._mode_all_btn.clicked.connect(lambda: self._on_segment_clicked("all"))
 
         self._mode_any_btn = QPushButton("ANY")
+        self._mode_any_btn.setObjectName("ModeSegmentBtn")
         self._mode_any_btn.setCheckable(True)
         self._mode_any_btn.setChecked(False)
         self._mode_any_btn.setCursor(Qt.PointingHandCursor)
         self._mode_any_btn.clicked.connect(lambda: self._on_segment_clicked("any"))
 
-        # Style for segmented buttons
-        segment_btn_style = f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {AppTheme.TEXT_SECONDARY};
-                border: none;
-                border-radius: 4px;
-                padding: 4px 12px;
-                font-size: 8pt;
-                font-weight: 600;
-                min-width: 40px;
-            }}
-            QPushButton:hover {{
-                background-color: {AppTheme.GRAY_200};
-                color: {AppTheme.TEXT};
-            }}
-            QPushButton:checked {{
-                background-color: {AppTheme.PRIMARY};
-                color: #FFFFFF;
-            }}
-            QPushButton:checked:hover {{
-                background-color: {AppTheme.PRIMARY_DARK};
-            }}
-        """
-        self._mode_all_btn.setStyleSheet(segment_btn_style)
-        self._mode_any_btn.setStyleSheet(segment_btn_style)
-
         segment_layout.addWidget(self._mode_all_btn)
         segment_layout.addWidget(self._mode_any_btn)
 
-        self._segment_container.setStyleSheet(
-            f"""
-            QFrame {{
-                background-color: {AppTheme.GRAY_100};
-                border: 1px solid {AppTheme.GRAY_200};
-                border-radius: 6px;
-            }}
-            """
-        )
         mode_layout.addWidget(self._segment_container, 1)
 
         # Hidden combo for compatibility with existing code
@@ -456,30 +490,14 @@ class ModernFilterPanel(QWidget):
         self.mode_combo.addItem("ANY (OR)", "any")
         self.mode_combo.setVisible(False)
 
-        self.mode_bar.setStyleSheet(
-            f"""
-            QFrame {{
-                background-color: {AppTheme.SURFACE};
-                border: 1px solid {AppTheme.GRAY_200};
-                border-radius: 6px;
-            }}
-            """
-        )
         mode_wrapper_layout.addWidget(self.mode_bar)
         layout.addWidget(mode_wrapper)
 
         self.scroll_area = QScrollArea()
+        self.scroll_area.setObjectName("FilterScrollArea")
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setFrameShape(QFrame.NoFrame)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.scroll_area.setStyleSheet(
-            f"""
-            QScrollArea {{
-                background-color: {AppTheme.BACKGROUND};
-                border: none;
-            }}
-            """
-        )
 
         self.filters_container = QWidget()
         self.filters_layout = QVBoxLayout(self.filters_container)
@@ -488,32 +506,16 @@ class ModernFilterPanel(QWidget):
         self.filters_layout.setAlignment(Qt.AlignTop)
 
         self.empty_label = QLabel("No active rules.\nUse Add Rule to begin.")
+        self.empty_label.setObjectName("FilterEmptyLabel")
         self.empty_label.setAlignment(Qt.AlignCenter)
-        self.empty_label.setStyleSheet(
-            f"""
-            color: {AppTheme.TEXT_SECONDARY};
-            font-size: 10pt;
-            font-weight: 400;
-            padding: 36px 16px;
-            """
-        )
         self.filters_layout.addWidget(self.empty_label)
 
         self.scroll_area.setWidget(self.filters_container)
         layout.addWidget(self.scroll_area, 1)
 
         self.stats_label = QLabel("No rules active")
+        self.stats_label.setObjectName("FilterStatsLabel")
         self.stats_label.setAlignment(Qt.AlignCenter)
-        self.stats_label.setStyleSheet(
-            f"""
-            background-color: {AppTheme.BACKGROUND};
-            color: {AppTheme.TEXT_SECONDARY};
-            font-size: 9pt;
-            font-weight: 400;
-            padding: 9px;
-            border-top: 1px solid {AppTheme.GRAY_200};
-            """
-        )
         layout.addWidget(self.stats_label)
 
         self._update_dynamic_width()
@@ -522,51 +524,182 @@ class ModernFilterPanel(QWidget):
         if self.empty_label.isVisible():
             self.empty_label.hide()
 
-        chip = ModernFilterChip(filter_rule)
-        chip.removeClicked.connect(self._on_remove_filter)
-        chip.editClicked.connect(self._on_edit_filter)
-        chip.tabRequested.connect(self.ruleTabRequested.emit)
+        self.active_filters.append(filter_rule)
+        if self._chips_deferred():
+            self._pending_rules.append(filter_rule)
+        else:
+            self._add_chip(filter_rule)
+        self._request_refresh()
+
+    def add_filters(self, filter_rules):
+        """Add several rules with one repaint and one footer/width refresh."""
+        with self.batch():
+            for filter_rule in filter_rules:
+                self.add_filter(filter_rule)
+
+    def _add_chip(self, filter_rule: FilterRule):
+        if self._chip_pool:
+            chip = self._chip_pool.pop()
+            chip.reconfigure(filter_rule)
+        else:
+            chip = ModernFilterChip(filter_rule)
+            chip.removeClicked.connect(self._on_remove_filter)
+            chip.editClicked.connect(self.filterEdited)
+            chip.tabRequested.connect(self.ruleTabRequested)
+            chip.sizeHintChanged.connect(self._on_chip_size_hint_changed)
 
         self.filters_layout.addWidget(chip)
-        self.active_filters.append(filter_rule)
-        self._update_stats()
-        self._update_dynamic_width()
+        chip.show()
+        self._chip_by_rule.setdefault(id(filter_rule), chip)
+        self._chip_widths[chip] = 0
+
+    def _on_chip_size_hint_changed(self, chip: ModernFilterChip):
+        # Re-measure on the next width refresh; pooled chips are not tracked.
+        if chip in self._chip_widths:
+            self._chip_widths[chip] = 0
+
+    def _chips_deferred(self) -> bool:
+        # Chips cannot be seen while the panel is hidden or collapsed.
+        return not self.isVisible() or self._is_collapsed
+
+    def _build_pending_chips(self):
+        if not self._pending_rules or self._chips_deferred():
+            return
+        pending, self._pending_rules = self._pending_rules, []
+        with self.batch():
+            for filter_rule in pending:
+                self._add_chip(filter_rule)
+            self._stats_dirty = True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._build_pending_chips()
 
     def remove_filter(self, filter_rule: FilterRule):
-        for i in range(self.filters_layout.count()):
-            widget = self.filters_layout.itemAt(i).widget()
-            if isinstance(widget, ModernFilterChip) and widget.filter_rule == filter_rule:
-                widget.deleteLater()
+        chip = self._chip_by_rule.pop(id(filter_rule), None)
+        removed = chip is not None or self._discard_pending(filter_rule, by_identity=True)
+        if not removed:
+            # An equal rule that is not the chip's own object.
+            chip = self._find_chip(filter_rule)
+            if chip is not None:
+                self._chip_by_rule.pop(id(chip.filter_rule), None)
+            removed = chip is not None or self._discard_pending(filter_rule, by_identity=False)
+        if chip is not None:
+            self.filters_layout.removeWidget(chip)
+            self._release_chip(chip)
+        if removed:
+            # Match by identity first: list.remove() would run __eq__ (a set
+            # build for TextFilter) against every rule ahead of this one.
+            for i, rule in enumerate(self.active_filters):
+                if rule is filter_rule:
+                    del self.active_filters[i]
+                    break
+            else:
                 self.active_filters.remove(filter_rule)
-                break
 
         if not self.active_filters:
             self.empty_label.show()
 
-        self._update_stats()
-        self._update_dynamic_width()
+        self._request_refresh()
 
     def clear_all_filters(self):
-        for i in range(self.filters_layout.count() - 1, -1, -1):
-            item = self.filters_layout.itemAt(i)
-            widget = item.widget() if item else None
-            if widget is None or widget is self.empty_label:
-                continue
-            self.filters_layout.takeAt(i)
-            widget.deleteLater()
-
-        self.active_filters.clear()
-        self.empty_label.show()
+        with self.batch():
+            chips = []
+            for i in range(self.filters_layout.count() - 1, -1, -1):
+                item = self.filters_layout.itemAt(i)
+                widget = item.widget() if item else None
+                if widget is None or widget is self.empty_label:
+                    continue
+                self.filters_layout.takeAt(i)
+                chips.append(widget)
+            for widget in chips:
+                self._release_chip(widget)
+
+            self.active_filters.clear()
+            self._pending_rules.clear()
+            self._chip_by_rule.clear()
+            self.empty_label.show()
+            self._update_stats()
+            self._update_dynamic_width()
+
+    def begin_batch(self):
+        """Suspend chip list repaints until the matching end_batch().
+
+        Calls nest; the list repaints once when the outermost batch ends.
+        """
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self.filters_container.setUpdatesEnabled(False)
+
+    def end_batch(self):
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            # Re-enabling updates schedules a single repaint of the list.
+            self.filters_container.setUpdatesEnabled(True)
+            if self._stats_dirty:
+                self._request_refresh()
+
+    def _request_refresh(self):
+        """Queue one footer/width refresh for the next event loop pass.
+
+        Back-to-back add_filter()/remove_filter()/set_context() calls and
+        batches collapse into a single trailing refresh, so a tab switch
+        measures the chips once.
+        """
+        self._stats_dirty = True
+        if self._batch_depth or self._refresh_queued:
+            return
+        self._refresh_queued = True
+        QTimer.singleShot(0, self._flush_refresh)
+
+    def _flush_refresh(self):
+        self._refresh_queued = False
+        if self._batch_depth or not self._stats_dirty:
+            # An open batch refreshes when it ends; end_batch() may have
+            # already handled it.
+            return
+        self._stats_dirty = False
         self._update_stats()
         self._update_dynamic_width()
 
+    @contextmanager
+    def batch(self):
+        """Context manager form of begin_batch()/end_batch()."""
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def _release_chip(self, chip: ModernFilterChip):
+        """Hide a chip taken out of the layout and keep it for reuse."""
+        chip.hide()
+        self._chip_widths.pop(chip, None)
+        if len(self._chip_pool) < self.CHIP_POOL_LIMIT:
+            self._chip_pool.append(chip)
+        else:
+            chip.deleteLater()
+
+    def _discard_pending(self, filter_rule: FilterRule, by_identity: bool) -> bool:
+        for i, pending in enumerate(self._pending_rules):
+            if pending is filter_rule or (not by_identity and pending == filter_rule):
+                del self._pending_rules[i]
+                return True
+        return False
+
+    def _find_chip(self, filter_rule: FilterRule):
+        for i in range(self.filters_layout.count()):
+            widget = self.filters_layout.itemAt(i).widget()
+            if isinstance(widget, ModernFilterChip) and widget.filter_rule == filter_rule:
+                return widget
+        return None
+
     def _on_remove_filter(self, filter_rule):
         self.remove_filter(filter_rule)
         self.filterRemoved.emit(filter_rule)
 
-    def _on_edit_filter(self, filter_rule):
-        self.filterEdited.emit(filter_rule, filter_rule)
-
     def _on_segment_clicked(self, mode: str):
         """Handle segmented control click."""
         if mode == "all":
@@ -584,6 +717,9 @@ class ModernFilterPanel(QWidget):
         self.filterModeChanged.emit(mode)
 
     def _update_stats(self):
+        if self._batch_depth:
+            self._stats_dirty = True
+            return
         count = len(self.active_filters)
         if count == 0:
             self.stats_label.setText("No rules active")
@@ -593,7 +729,10 @@ class ModernFilterPanel(QWidget):
             self.stats_label.setText(f"{count} rules active")
 
     def _update_dynamic_width(self):
-        if getattr(self, "_is_collapsed", False):
+        if self._is_collapsed:
+            return
+        if self._batch_depth:
+            self._stats_dirty = True
             return
 
         # Calculate content widths with proper minimum
@@ -603,14 +742,13 @@ class ModernFilterPanel(QWidget):
 
         widths = [min_width]
 
-        # Check filter chips (these are the main content that might need space)
-        for i in range(self.filters_layout.count()):
-            item = self.filters_layout.itemAt(i)
-            if item is None:
-                continue
-            widget = item.widget()
-            if widget is not None and widget.isVisible() and isinstance(widget, ModernFilterChip):
-                hint = widget.sizeHint().width()
+        # Check filter chips (these are the main content that might need space).
+        # A chip is measured once and later refreshes reuse the cached width
+        # until its styling changes (hover, sheet or font).
+        if self.isVisible():
+            for chip, hint in self._chip_widths.items():
+                if not hint:
+                    hint = self._chip_widths[chip] = chip.sizeHint().width()
                 if hint > 0:
                     widths.append(hint + padding)
 
@@ -620,89 +758,76 @@ class ModernFilterPanel(QWidget):
         self.widthSuggested.emit(desired)
 
     def get_current_mode(self) -> str:
-        if hasattr(self, "_mode_all_btn") and self._mode_all_btn.isChecked():
+        if self._mode_all_btn.isChecked():
             return "all"
-        elif hasattr(self, "_mode_any_btn") and self._mode_any_btn.isChecked():
+        elif self._mode_any_btn.isChecked():
             return "any"
         return self.mode_combo.currentData() or "all"
 
-    def get_filter_mode(self) -> str:
-        return self.get_current_mode()
+    get_filter_mode = get_current_mode
 
     def set_mode(self, mode: str):
-        # Update hidden combo
-        self.mode_combo.blockSignals(True)
-        try:
-            for i in range(self.mode_combo.count()):
-                if self.mode_combo.itemData(i) == mode:
-                    self.mode_combo.setCurrentIndex(i)
-                    break
-        finally:
-            self.mode_combo.blockSignals(False)
+        # Update hidden combo; tab switches usually re-apply the current mode.
+        index = self.mode_combo.findData(mode)
+        if index >= 0 and index != self.mode_combo.currentIndex():
+            self.mode_combo.blockSignals(True)
+            try:
+                self.mode_combo.setCurrentIndex(index)
+            finally:
+                self.mode_combo.blockSignals(False)
 
         # Update segmented control
-        if hasattr(self, "_mode_all_btn") and hasattr(self, "_mode_any_btn"):
-            self._mode_all_btn.setChecked(mode == "all")
-            self._mode_any_btn.setChecked(mode == "any")
+        self._mode_all_btn.setChecked(mode == "all")
+        self._mode_any_btn.setChecked(mode == "any")
 
-    def set_filter_mode(self, mode: str):
-        self.set_mode(mode)
+    set_filter_mode = set_mode
 
     def set_mode_enabled(self, enabled: bool):
         self.mode_combo.setEnabled(enabled)
-        if hasattr(self, "mode_label"):
-            self.mode_label.setEnabled(enabled)
-        if hasattr(self, "_mode_all_btn"):
-            self._mode_all_btn.setEnabled(enabled)
-        if hasattr(self, "_mode_any_btn"):
-            self._mode_any_btn.setEnabled(enabled)
+        self.mode_label.setEnabled(enabled)
+        self._mode_all_btn.setEnabled(enabled)
+        self._mode_any_btn.setEnabled(enabled)
 
     def set_action_controls_visible(self, visible: bool):
-        if hasattr(self, "control_bar"):
-            self.control_bar.setVisible(visible)
+        self.control_bar.setVisible(visible)
 
     def set_mode_visible(self, visible: bool):
-        if hasattr(self, "mode_bar"):
-            self.mode_bar.setVisible(visible)
+        self.mode_bar.setVisible(visible)
 
     def set_collapse_available(self, visible: bool):
-        if hasattr(self, "collapse_btn"):
-            self.collapse_btn.setVisible(visible)
+        self.collapse_btn.setVisible(visible)
 
     def set_collapsed(self, collapsed: bool):
         self._is_collapsed = collapsed
-        if hasattr(self, "collapse_btn"):
-            self.collapse_btn.setText(">" if collapsed else "<")
-            self.collapse_btn.setToolTip("Expand panel" if collapsed else "Collapse panel")
-
-        if hasattr(self, "title_label"):
-            self.title_label.setVisible(not collapsed)
-        if hasattr(self, "logo_label"):
-            self.logo_label.setVisible(not collapsed)
-
-        for widget in [
-            getattr(self, "subtitle_label", None),
-            getattr(self, "control_bar", None),
-            getattr(self, "mode_bar", None),
-            getattr(self, "scroll_area", None),
-            getattr(self, "stats_label", None),
-        ]:
-            if widget is not None:
-                widget.setVisible(not collapsed)
+        self.collapse_btn.setText(">" if collapsed else "<")
+        self.collapse_btn.setToolTip("Expand panel" if collapsed else "Collapse panel")
+
+        # Every section is created by _setup_ui, so no existence checks.
+        for widget in (
+            self.title_label,
+            self.logo_label,
+            self.subtitle_label,
+            self.control_bar,
+            self.mode_bar,
+            self.scroll_area,
+            self.stats_label,
+        ):
+            widget.setVisible(not collapsed)
+
+        if not collapsed:
+            self._build_pending_chips()
 
     def _on_collapse_clicked(self):
-        new_state = not getattr(self, "_is_collapsed", False)
+        new_state = not self._is_collapsed
         self.collapseToggled.emit(new_state)
 
     def set_context(self, title: str, subtitle: str):
-        if hasattr(self, "title_label") and title is not None:
+        if title is not None:
             self.title_label.setText(title)
-        if hasattr(self, "subtitle_label") and subtitle is not None:
+        if subtitle is not None:
             self.subtitle_label.setText(subtitle)
-        self._update_dynamic_width()
-
-    def add_filter_chip(self, filter_rule: FilterRule):
-        self.add_filter(filter_rule)
+        self._request_refresh()
 
-    def clear_all_chips(self):
-        self.clear_all_filters()
+    # Names used by MainWindow; bound to the same functions, no extra frame.
+    add_filter_chip = add_filter
+    clear_all_chips = clear_all_filters
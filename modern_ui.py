@@ -3,7 +3,6 @@ Modern UI components for the main window.
 """
 
 import logging
-import os
 from typing import List, Optional
 
 from PyQt5.QtCore import Qt, pyqtSignal
@@ -28,9 +27,6 @@ logger = logging.getLogger("StudentManager.ModernUI")
 def _load_scaled_logo(filename: str, max_width: int, max_height: int) -> Optional[QPixmap]:
     """Load and scale a logo asset if available."""
     path = AppTheme.asset_path(filename)
-    if not os.path.exists(path):
-        return None
-
     pixmap = QPixmap(path)
     if pixmap.isNull():
         return None
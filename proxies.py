@@ -32,6 +32,15 @@ class SmartSearchProxy(QSortFilterProxyModel):
         self.search_column = column_name
         self.invalidateFilter()
 
+    def setSearch(self, text: str, column_name: Optional[str]):
+        """Set search text and column together with a single re-filter."""
+        text = text.strip()
+        if text == self.search_text and column_name == self.search_column:
+            return
+        self.search_text = text
+        self.search_column = column_name
+        self.invalidateFilter()
+
     # Backward-compatible aliases used by the modern search bar handler.
     def setGlobalSearchTerm(self, text: str):
         self.search_text = text.strip()
@@ -49,6 +58,8 @@ class SmartSearchProxy(QSortFilterProxyModel):
             self.invalidateFilter()
     
     def setExtraFilters(self, filters: Optional[list]):
+        if not filters and not self.extra_filters:
+            return
         self.extra_filters = list(filters) if filters else []
         self.invalidateFilter()
 
@@ -0,0 +1,43 @@
+"""
+Shared fixtures: an offscreen QApplication and a MainWindow isolated in a temp dir.
+"""
+
+import os
+import sys
+import threading
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+
+def _skip_autoload(self):
+    """Stand-in for MainWindow._autoload_last_file.
+
+    MainWindow queues the autoload with a 100 ms QTimer.singleShot that can
+    fire after the test, so the stub must outlive the monkeypatch.
+    """
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def main_window(qapp, tmp_path, monkeypatch):
+    """MainWindow writing its state/archives under tmp_path, without autoload."""
+    from main_window import MainWindow
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(MainWindow, "_autoload_last_file", _skip_autoload)
+    window = MainWindow()
+    yield window
+    window.close()
+    qapp.processEvents()
+    # The close-time snapshot writes relative to the cwd; finish it in tmp_path.
+    for thread in threading.enumerate():
+        if thread.name == "final-snapshot":
+            thread.join()
@@ -0,0 +1,55 @@
+"""
+ModernFilterPanel styling as seen inside the real MainWindow.
+"""
+
+
+def test_main_window_keeps_panel_stylesheet(main_window):
+    sheet = main_window.filter_panel.styleSheet()
+    assert "ChipTag" in sheet
+    assert 'ModernFilterChip[hovered="true"]' in sheet
+    assert "ModernFilterPanel {" in sheet
+
+
+def test_chip_menu_is_styled_by_panel_sheet(main_window, qapp, monkeypatch):
+    from PyQt5.QtCore import QPoint
+    from PyQt5.QtGui import QContextMenuEvent
+    from PyQt5.QtWidgets import QMenu
+    from models import NumericFilter
+
+    panel = main_window.filter_panel
+    main_window.show()
+    rule = NumericFilter("A", ">=", 1)
+    panel.add_filter(rule)
+    qapp.processEvents()
+
+    monkeypatch.setattr(QMenu, "exec_", lambda self, *args: None)
+    chip = panel._chip_by_rule[id(rule)]
+    chip.contextMenuEvent(QContextMenuEvent(QContextMenuEvent.Mouse, QPoint(1, 1), QPoint(1, 1)))
+
+    # The menu has no sheet of its own; it relies on the panel's descendant rules.
+    assert chip._menu.parent() is chip and panel.isAncestorOf(chip)
+    assert "ModernFilterChip QMenu::item:selected" in panel.styleSheet()
+
+
+def test_hover_remeasures_chip_width(main_window, qapp):
+    from models import TextFilter
+
+    panel = main_window.filter_panel
+    main_window.show()
+    rule = TextFilter("Major", ["Mathematics and Computer Science"])
+    panel.add_filter(rule)
+    qapp.processEvents()
+    chip = panel._chip_by_rule[id(rule)]
+    panel._update_dynamic_width()
+    assert panel._chip_widths[chip] == chip.sizeHint().width()
+
+    # The hovered label is bold, so the cached width must not be reused.
+    chip._update_style(hovered=True)
+    assert panel._chip_widths[chip] == 0
+    panel._update_dynamic_width()
+    assert panel._chip_widths[chip] == chip.sizeHint().width()
+
+    font = chip.font()
+    font.setPointSize(font.pointSize() + 4)
+    chip.setFont(font)
+    assert panel._chip_widths[chip] == 0
@@ -0,0 +1,50 @@
+"""
+fused_filters.numeric_and: every available tier returns the same mask.
+"""
+
+import operator
+
+import numpy as np
+import pytest
+
+import fused_filters
+from fused_filters import OP_CODES, numeric_and
+
+
+_OPERATORS = {
+    ">=": operator.ge, "<=": operator.le, "==": operator.eq,
+    ">": operator.gt, "<": operator.lt, "!=": operator.ne,
+}
+VALUES = np.array([np.nan, -1.0, 0.0, 2.5, 3.0, 7.0, np.inf])
+
+
+def _reference(values, rules):
+    return np.array([all(_OPERATORS[op](v, t) for op, t in rules) for v in values])
+
+
+def _use_tier(monkeypatch, tier):
+    if tier == "numba":
+        pytest.importorskip("numba")
+    elif tier == "numexpr":
+        pytest.importorskip("numexpr")
+        monkeypatch.setattr(fused_filters, "HAS_NUMBA", False)
+    else:
+        monkeypatch.setattr(fused_filters, "HAS_NUMBA", False)
+        monkeypatch.setattr(fused_filters, "HAS_NUMEXPR", False)
+
+
+@pytest.mark.parametrize("tier", ["numba", "numexpr", "numpy"])
+@pytest.mark.parametrize("rules", [
+    [(op, 2.5)] for op in OP_CODES
+] + [
+    [(">=", 0.0), ("<", 7.0)],
+    [("!=", 3.0), ("!=", 7.0)],
+    [(">", 0.0), ("<=", 3.0), ("!=", 2.5)],
+])
+def test_numeric_and_matches_plain_comparisons(monkeypatch, tier, rules):
+    _use_tier(monkeypatch, tier)
+    ops = np.array([OP_CODES[op] for op, _ in rules], dtype=np.int8)
+    thresholds = np.array([t for _, t in rules], dtype=np.float64)
+    mask = numeric_and(VALUES, ops, thresholds)
+    assert mask.dtype == bool
+    assert mask.tolist() == _reference(VALUES, rules).tolist()
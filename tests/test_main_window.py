@@ -0,0 +1,44 @@
+"""
+MainWindow rule-tab bookkeeping.
+"""
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def loaded_window(main_window, qapp, tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"Name": ["a", "b", "c"], "Score": [1, 5, 9]}).to_csv(path, index=False)
+    main_window.load_file(str(path))
+    qapp.processEvents()
+    return main_window
+
+
+def test_new_rule_tab_marks_navigator_column(loaded_window):
+    from models import NumericFilter
+
+    loaded_window.tab_widget.setCurrentIndex(0)
+    loaded_window._create_filter_tab([NumericFilter("Score", ">=", 5)], switch_to=False)
+    assert loaded_window.column_navigator.filtered_columns == {"Score"}
+
+
+def test_tab_names_with_parentheses_survive_refresh(loaded_window, tmp_path):
+    import json
+
+    index = loaded_window._create_custom_tab("Scores (2024)")
+    loaded_window._update_tab_counts()
+    assert loaded_window.tab_widget.tabText(index) == "Scores (2024)"
+    assert loaded_window.tab_widget.tabToolTip(index) == "3 rows"
+
+    loaded_window._do_save_state()
+    saved = json.loads((tmp_path / "app_state.json").read_text())
+    assert "Scores (2024)" in [tab["name"] for tab in saved["tabs"]]
+
+
+def test_snapshot_key_follows_exported_frame(loaded_window):
+    assert loaded_window._snapshot_key() == loaded_window._archived_snapshot_key
+
+    # Snapshots export window.df; replacing it alone must count as a change.
+    loaded_window.df = loaded_window.df.iloc[:2].copy()
+    assert loaded_window._snapshot_key() != loaded_window._archived_snapshot_key
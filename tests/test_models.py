@@ -0,0 +1,71 @@
+"""
+Filter rules and the data model.
+"""
+
+import datetime
+import os
+import subprocess
+import sys
+
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_date_filter_bounds_follow_field_changes():
+    from models import DateFilter
+
+    dates = pd.Series(pd.to_datetime(["2024-01-10", "2024-02-10", "2024-03-10"]))
+    rule = DateFilter("d", datetime.date(2024, 1, 1), datetime.date(2024, 1, 31))
+    assert rule.vector_mask(dates).tolist() == [True, False, False]
+
+    rule.start_date = datetime.date(2024, 2, 1)
+    rule.end_date = datetime.date(2024, 3, 31)
+    assert rule.to_dict()["start_date"] == "2024-02-01"
+    assert rule.vector_mask(dates).tolist() == [False, True, True]
+    assert [rule.matches(v) for v in dates] == [False, True, True]
+
+    rule.end_date = None
+    rule.start_date = None
+    assert rule.vector_mask(dates).tolist() == [True, True, True]
+
+
+def test_dataframe_copy_is_isolated(qapp):
+    from models import DataFrameModel
+
+    model = DataFrameModel(pd.DataFrame({"Score": [1.0, 2.0]}))
+    out = model.dataframe()
+    out.loc[0, "Score"] = 99.0
+    assert model.dataframe()["Score"].tolist() == [1.0, 2.0]
+
+
+def test_dataframe_keeps_loaded_dtypes(qapp):
+    from models import DataFrameModel
+
+    source = pd.DataFrame({
+        "Major": ["Math", "CS"] * 5,
+        "Tag": pd.array(["a", "b"] * 5, dtype="string"),
+        "Score": range(10),
+    })
+    model = DataFrameModel()
+    model.set_dataframe(source)
+    model.setData(model.index(0, 0), "Bio")
+    out = model.dataframe()
+    assert out.dtypes.equals(source.dtypes)
+    assert out["Major"].iloc[0] == "Bio"
+
+
+def test_importing_models_leaves_pandas_options_alone():
+    # A fresh interpreter: this session has already imported models.
+    script = (
+        "import pandas as pd\n"
+        "def cow():\n"
+        "    try:\n"
+        "        return pd.get_option('mode.copy_on_write')\n"
+        "    except KeyError:\n"
+        "        return None\n"
+        "before = cow()\n"
+        "import models\n"
+        "assert cow() == before, (before, cow())\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, check=True)
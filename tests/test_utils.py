@@ -0,0 +1,29 @@
+"""
+Loader helpers in utils.
+"""
+
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def test_to_arrow_strings_only_converts_string_columns():
+    pytest.importorskip("pyarrow")
+    from utils import to_arrow_strings
+
+    df = pd.DataFrame({
+        "name": pd.Series(["a", None, "c"], dtype=object),
+        "mixed": pd.Series([1, "x", np.nan], dtype=object),
+        "dates": pd.Series([datetime.date(2024, 1, 1), None, datetime.date(2024, 1, 3)], dtype=object),
+        "money": pd.Series([Decimal("1.5"), Decimal("2"), None], dtype=object),
+        "meta": pd.Series([{"k": 1}, {}, None], dtype=object),
+    })
+    out = to_arrow_strings(df)
+
+    assert out["name"].dtype == "string[pyarrow]"
+    for col in ("mixed", "dates", "money", "meta"):
+        assert out[col].dtype == object
+        pd.testing.assert_series_equal(out[col], df[col])
@@ -4,6 +4,7 @@ Supports: Excel (.xlsx, .xls, .xlsm), CSV, TSV, JSON
 """
 
 import os
+import json
 import datetime
 import numpy as np
 import pandas as pd
@@ -11,9 +12,25 @@ from typing import Optional, Tuple
 from openpyxl.utils import get_column_letter
 from openpyxl.styles import Font, PatternFill
 
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 DATE_COL_NAME = "Date Added"
 
+# Store text columns as Arrow-backed strings when pyarrow is available so the
+# .str kernels used by TextFilter run in C++ instead of over Python objects.
+USE_ARROW_STRINGS = HAS_PYARROW
+
 
 def smart_cast_dtypes(df: pd.DataFrame) -> pd.DataFrame:
     """Intelligently detect and cast column data types."""
@@ -56,6 +73,28 @@ def smart_cast_dtypes(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert text columns to string[pyarrow]; numeric/date columns are left as-is."""
+    if not HAS_PYARROW:
+        return df
+    # astype() would str() every value of a mixed object column (numbers,
+    # dates, dicts...) without raising, so only all-string columns qualify.
+    text_cols = [
+        col for col in df.columns
+        if isinstance(df[col].dtype, pd.StringDtype)
+        or (df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) == "string")
+    ]
+    if not text_cols:
+        return df
+    converted = {}
+    for col in text_cols:
+        try:
+            converted[col] = df[col].astype("string[pyarrow]")
+        except Exception:
+            continue
+    return df.assign(**converted) if converted else df
+
+
 def load_dataframe_from_file(filepath: str, sheet_name: Optional[str] = None) -> Tuple[pd.DataFrame, bool, list]:
     """Load DataFrame from Excel, CSV, TSV, or JSON file."""
     filepath_lower = filepath.lower()
@@ -98,6 +137,8 @@ def load_dataframe_from_file(filepath: str, sheet_name: Optional[str] = None) ->
         
         df.columns = [str(c) for c in df.columns]
         df = smart_cast_dtypes(df)
+        if USE_ARROW_STRINGS:
+            df = to_arrow_strings(df)
         
         return df, False, sheet_names
         
@@ -352,6 +393,32 @@ def load_filters_from_file(filepath: str = "app_filters.json"):
         return []
 
 
+def read_json_file(filepath: str):
+    """Parse a JSON file, using orjson's C decoder when it is installed."""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json_file_atomic(filepath: str, obj):
+    """Write compact JSON to a temp file and swap it into place."""
+    payload = None
+    if HAS_ORJSON:
+        try:
+            payload = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # Types orjson refuses (e.g. float subclasses) go through json.
+            payload = None
+    if payload is None:
+        payload = json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, filepath)
+
+
 def get_last_loaded_file(filepath: str = "app_last_file.txt") -> Optional[str]:
     """Get the path of the last loaded file."""
     if not os.path.exists(filepath):
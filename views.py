@@ -23,6 +23,14 @@ class StyledTableView(QTableView):
     columnFilterRequested = pyqtSignal(str)
     columnFilterClearRequested = pyqtSignal(str)
     
+    # Tab metadata used by MainWindow. Class-level defaults let hot loops read
+    # these directly instead of getattr(..., default); tab_filters stays
+    # per-instance because it is a mutable list.
+    tab_kind = None
+    tab_filter_mode = "all"
+    tab_filters_version = 0
+    file_path = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.allow_column_filters = True
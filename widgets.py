@@ -15,10 +15,60 @@ from PyQt5.QtGui import QFont, QPalette, QColor, QIcon
 from styles import AppTheme
 from models import FilterRule, NumericFilter, TextFilter, DateFilter
 import pandas as pd
-from typing import Optional, List
+from typing import Dict, Optional, List
 import datetime
 
 
+# FilterChip sheets are formatted once here rather than for every chip.
+# The label's hover colour follows the chip's "hovered" property, so hover
+# events only repolish instead of swapping stylesheets.
+_FILTER_CHIP_QSS = f"""
+    FilterChip {{
+        background-color: {AppTheme.PRIMARY_LIGHT};
+        border: 2px solid {AppTheme.PRIMARY};
+        border-radius: 8px;
+        padding: 8px 12px;
+    }}
+    FilterChip:hover {{
+        background-color: {AppTheme.PRIMARY};
+        border-color: {AppTheme.PRIMARY_DARK};
+    }}
+    FilterChip > QLabel {{
+        background: transparent;
+        border: none;
+        color: #111827;
+        font-weight: 600;
+    }}
+    FilterChip[hovered="true"] > QLabel {{
+        color: #FFFFFF;
+    }}
+"""
+_FILTER_CHIP_REMOVE_QSS = f"""
+    QPushButton {{
+        background-color: {AppTheme.ERROR};
+        color: #FFFFFF;
+        border: none;
+        font-size: 12px;
+        font-weight: 700;
+        border-radius: 10px;
+    }}
+    QPushButton:hover {{
+        background-color: #DC2626;
+    }}
+"""
+_FILTER_CHIP_MENU_QSS = f"""
+    QMenu {{
+        background-color: {AppTheme.BACKGROUND};
+        color: {AppTheme.TEXT};
+        border: 2px solid {AppTheme.BORDER};
+    }}
+    QMenu::item:selected {{
+        background-color: {AppTheme.PRIMARY};
+        color: #FFFFFF;
+    }}
+"""
+
+
 class FilterChip(QFrame):
     """A visual chip representing an active filter - no emojis."""
     
@@ -29,22 +79,13 @@ class FilterChip(QFrame):
     def __init__(self, filter_rule: FilterRule, parent=None):
         super().__init__(parent)
         self.filter_rule = filter_rule
+        self._hovered = False
+        self._menu = None
         self._setup_ui()
     
     def _setup_ui(self):
         self.setFrameStyle(QFrame.StyledPanel | QFrame.Raised)
-        self.setStyleSheet(f"""
-            FilterChip {{
-                background-color: {AppTheme.PRIMARY_LIGHT};
-                border: 2px solid {AppTheme.PRIMARY};
-                border-radius: 8px;
-                padding: 8px 12px;
-            }}
-            FilterChip:hover {{
-                background-color: {AppTheme.PRIMARY};
-                border-color: {AppTheme.PRIMARY_DARK};
-            }}
-        """)
+        self.setStyleSheet(_FILTER_CHIP_QSS)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(10, 6, 10, 6)
@@ -53,12 +94,6 @@ class FilterChip(QFrame):
         # Filter text
         filter_text = str(self.filter_rule)
         self.label = QLabel(filter_text)
-        self.label.setStyleSheet("""
-            background: transparent; 
-            border: none;
-            color: #111827;
-            font-weight: 600;
-        """)
         font = self.label.font()
         font.setPointSize(10)
         self.label.setFont(font)
@@ -66,20 +101,8 @@ class FilterChip(QFrame):
         # Remove button - X instead of emoji
         self.remove_btn = QPushButton("X")
         self.remove_btn.setFixedSize(20, 20)
-        self.remove_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {AppTheme.ERROR};
-                color: #FFFFFF;
-                border: none;
-                font-size: 12px;
-                font-weight: 700;
-                border-radius: 10px;
-            }}
-            QPushButton:hover {{
-                background-color: #DC2626;
-            }}
-        """)
-        self.remove_btn.clicked.connect(lambda: self.removeClicked.emit(self.filter_rule))
+        self.remove_btn.setStyleSheet(_FILTER_CHIP_REMOVE_QSS)
+        self.remove_btn.clicked.connect(self._emit_remove)
         
         layout.addWidget(self.label)
         layout.addWidget(self.remove_btn)
@@ -88,45 +111,103 @@ class FilterChip(QFrame):
     
     def enterEvent(self, event):
         """Change label color on hover."""
-        self.label.setStyleSheet("""
-            background: transparent;
-            border: none;
-            color: #FFFFFF;
-            font-weight: 600;
-        """)
+        self._set_hovered(True)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
         """Restore label color."""
-        self.label.setStyleSheet("""
-            background: transparent;
-            border: none;
-            color: #111827;
-            font-weight: 600;
-        """)
+        self._set_hovered(False)
         super().leaveEvent(event)
 
+    def _set_hovered(self, hovered: bool):
+        if hovered == self._hovered:
+            # Spurious enter/leave during relayouts; nothing to repolish.
+            return
+        self._hovered = hovered
+        self.setProperty("hovered", hovered)
+        style = self.label.style()
+        style.unpolish(self.label)
+        style.polish(self.label)
+
+    # Bound-method slots instead of per-chip lambdas.
+    def _emit_remove(self):
+        self.removeClicked.emit(self.filter_rule)
+
+    def _emit_open_tab(self):
+        self.openTabRequested.emit(self.filter_rule)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.editClicked.emit(self.filter_rule)
         super().mousePressEvent(event)
 
     def contextMenuEvent(self, event):
-        menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {AppTheme.BACKGROUND};
-                color: {AppTheme.TEXT};
-                border: 2px solid {AppTheme.BORDER};
-            }}
-            QMenu::item:selected {{
-                background-color: {AppTheme.PRIMARY};
-                color: #FFFFFF;
-            }}
-        """)
-        open_action = menu.addAction("Preview Tab")
-        open_action.triggered.connect(lambda: self.openTabRequested.emit(self.filter_rule))
-        menu.exec_(event.globalPos())
+        if self._menu is None:
+            # Built on the first right-click and reused.
+            self._menu = QMenu(self)
+            self._menu.setStyleSheet(_FILTER_CHIP_MENU_QSS)
+            open_action = self._menu.addAction("Preview Tab")
+            open_action.triggered.connect(self._emit_open_tab)
+        self._menu.exec_(event.globalPos())
+
+
+# One sheet for the whole FilterPanel; its widgets are matched by object name.
+_FILTER_PANEL_QSS = f"""
+    QLabel#FilterPanelTitle {{
+        color: {AppTheme.TEXT};
+    }}
+    QLabel#FilterPanelSubtitle, QLabel#FilterPanelModeLabel {{
+        color: {AppTheme.TEXT_SECONDARY};
+        font-size: 9pt;
+    }}
+    QComboBox#FilterPanelModeCombo {{
+        padding: 4px 8px;
+        font-size: 9pt;
+        color: {AppTheme.TEXT};
+    }}
+    QScrollArea#FilterPanelScroll {{
+        background-color: {AppTheme.BACKGROUND};
+        border: 2px solid {AppTheme.BORDER};
+    }}
+    QLabel#FilterPanelEmpty {{
+        color: {AppTheme.TEXT_SECONDARY};
+        font-style: italic;
+    }}
+    QPushButton#FilterPanelAddBtn {{
+        background-color: {AppTheme.PRIMARY};
+        color: #FFFFFF;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 16px;
+        font-weight: 600;
+        font-size: 11pt;
+    }}
+    QPushButton#FilterPanelAddBtn:hover {{
+        background-color: {AppTheme.PRIMARY_DARK};
+    }}
+    QPushButton#FilterPanelAddBtn:pressed {{
+        background-color: {AppTheme.PRIMARY_HOVER};
+    }}
+    QPushButton#FilterPanelClearBtn {{
+        background-color: {AppTheme.ERROR};
+        color: #FFFFFF;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 16px;
+        font-weight: 600;
+        font-size: 11pt;
+    }}
+    QPushButton#FilterPanelClearBtn:hover {{
+        background-color: #DC2626;
+    }}
+    QPushButton#FilterPanelClearBtn:pressed {{
+        background-color: #B91C1C;
+    }}
+    QPushButton#FilterPanelClearBtn:disabled {{
+        background-color: {AppTheme.GRAY_300};
+        color: {AppTheme.GRAY_500};
+    }}
+"""
 
 
 class FilterPanel(QWidget):
@@ -134,16 +215,20 @@ class FilterPanel(QWidget):
     
     filterAdded = pyqtSignal(object)
     filterRemoved = pyqtSignal(object)
-    filterEdited = pyqtSignal(object, object)
+    filterEdited = pyqtSignal(object)
     allFiltersCleared = pyqtSignal()
     filterModeChanged = pyqtSignal(str)
     ruleTabRequested = pyqtSignal(object)
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Chip for each rule object, keyed by id() since rules compare by value.
+        self._chip_by_rule: Dict[int, FilterChip] = {}
         self._setup_ui()
     
     def _setup_ui(self):
+        self.setStyleSheet(_FILTER_PANEL_QSS)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(16)
@@ -154,29 +239,23 @@ class FilterPanel(QWidget):
         title_font.setPointSize(12)
         title_font.setBold(True)
         self.title_label.setFont(title_font)
-        self.title_label.setStyleSheet(f"color: {AppTheme.TEXT};")
+        self.title_label.setObjectName("FilterPanelTitle")
         layout.addWidget(self.title_label)
 
         self.subtitle_label = QLabel("Add rules to filter and highlight rows in the table below")
-        self.subtitle_label.setStyleSheet(f"color: {AppTheme.TEXT_SECONDARY}; font-size: 9pt;")
+        self.subtitle_label.setObjectName("FilterPanelSubtitle")
         self.subtitle_label.setWordWrap(True)
         layout.addWidget(self.subtitle_label)
 
         mode_layout = QHBoxLayout()
         mode_label = QLabel("Combine:")
-        mode_label.setStyleSheet(f"color: {AppTheme.TEXT_SECONDARY}; font-size: 9pt;")
+        mode_label.setObjectName("FilterPanelModeLabel")
         mode_layout.addWidget(mode_label)
 
         self.mode_combo = QComboBox()
         self.mode_combo.addItem("Match ALL (AND)", "all")
         self.mode_combo.addItem("Match ANY (OR)", "any")
-        self.mode_combo.setStyleSheet(f"""
-            QComboBox {{
-                padding: 4px 8px;
-                font-size: 9pt;
-                color: {AppTheme.TEXT};
-            }}
-        """)
+        self.mode_combo.setObjectName("FilterPanelModeCombo")
         self.mode_combo.currentIndexChanged.connect(self._on_mode_changed)
         mode_layout.addWidget(self.mode_combo)
         mode_layout.addStretch()
@@ -188,12 +267,7 @@ class FilterPanel(QWidget):
         self.filters_scroll.setWidgetResizable(True)
         self.filters_scroll.setFrameStyle(QFrame.StyledPanel)
         self.filters_scroll.setMinimumHeight(200)
-        self.filters_scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {AppTheme.BACKGROUND};
-                border: 2px solid {AppTheme.BORDER};
-            }}
-        """)
+        self.filters_scroll.setObjectName("FilterPanelScroll")
         
         self.filters_container = QWidget()
         self.filters_layout = QVBoxLayout(self.filters_container)
@@ -212,47 +286,11 @@ class FilterPanel(QWidget):
         btn_layout.setSpacing(8)
         
         self.add_btn = QPushButton("Add Filter")
-        self.add_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {AppTheme.PRIMARY};
-                color: #FFFFFF;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 16px;
-                font-weight: 600;
-                font-size: 11pt;
-            }}
-            QPushButton:hover {{
-                background-color: {AppTheme.PRIMARY_DARK};
-            }}
-            QPushButton:pressed {{
-                background-color: {AppTheme.PRIMARY_HOVER};
-            }}
-        """)
+        self.add_btn.setObjectName("FilterPanelAddBtn")
         self.add_btn.clicked.connect(self._on_add_filter)
         
         self.clear_btn = QPushButton("Clear All")
-        self.clear_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {AppTheme.ERROR};
-                color: #FFFFFF;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 16px;
-                font-weight: 600;
-                font-size: 11pt;
-            }}
-            QPushButton:hover {{
-                background-color: #DC2626;
-            }}
-            QPushButton:pressed {{
-                background-color: #B91C1C;
-            }}
-            QPushButton:disabled {{
-                background-color: {AppTheme.GRAY_300};
-                color: {AppTheme.GRAY_500};
-            }}
-        """)
+        self.clear_btn.setObjectName("FilterPanelClearBtn")
         self.clear_btn.clicked.connect(self._on_clear_all)
         self.clear_btn.setEnabled(False)
         
@@ -269,21 +307,28 @@ class FilterPanel(QWidget):
             label.setParent(None)
         
         chip = FilterChip(filter_rule)
-        chip.removeClicked.connect(self._on_remove_filter)
-        chip.editClicked.connect(self._on_edit_filter)
-        chip.openTabRequested.connect(self._on_open_rule_tab)
+        chip.removeClicked.connect(self.filterRemoved)
+        chip.editClicked.connect(self.filterEdited)
+        chip.openTabRequested.connect(self.ruleTabRequested)
         self.filters_layout.addWidget(chip)
+        self._chip_by_rule.setdefault(id(filter_rule), chip)
         
         self.clear_btn.setEnabled(True)
     
     def remove_filter_chip(self, filter_rule: FilterRule):
         """Remove a filter chip from the display."""
-        for i in range(self.filters_layout.count()):
-            widget = self.filters_layout.itemAt(i).widget()
-            if isinstance(widget, FilterChip) and widget.filter_rule == filter_rule:
-                widget.setParent(None)
-                widget.deleteLater()
-                break
+        chip = self._chip_by_rule.pop(id(filter_rule), None)
+        if chip is None:
+            # An equal rule that is not the chip's own object.
+            for i in range(self.filters_layout.count()):
+                widget = self.filters_layout.itemAt(i).widget()
+                if isinstance(widget, FilterChip) and widget.filter_rule == filter_rule:
+                    chip = widget
+                    self._chip_by_rule.pop(id(chip.filter_rule), None)
+                    break
+        if chip is not None:
+            chip.setParent(None)
+            chip.deleteLater()
         
         if self.filters_layout.count() == 0:
             self.filters_layout.addWidget(self._get_no_filters_label())
@@ -292,16 +337,22 @@ class FilterPanel(QWidget):
     def clear_all_chips(self):
         """Remove all filter chips."""
         label = self._get_no_filters_label()
-        while self.filters_layout.count() > 0:
-            widget = self.filters_layout.itemAt(0).widget()
-            if widget:
-                if widget is label:
-                    widget.setParent(None)
-                else:
-                    widget.setParent(None)
-                    widget.deleteLater()
-        
-        self.filters_layout.addWidget(self._get_no_filters_label())
+        # One repaint for the whole clear instead of one per chip.
+        self.filters_container.setUpdatesEnabled(False)
+        try:
+            while self.filters_layout.count() > 0:
+                widget = self.filters_layout.itemAt(0).widget()
+                if widget:
+                    if widget is label:
+                        widget.setParent(None)
+                    else:
+                        widget.setParent(None)
+                        widget.deleteLater()
+            self._chip_by_rule.clear()
+            
+            self.filters_layout.addWidget(self._get_no_filters_label())
+        finally:
+            self.filters_container.setUpdatesEnabled(True)
         self.clear_btn.setEnabled(False)
     
     def _on_add_filter(self):
@@ -321,15 +372,6 @@ class FilterPanel(QWidget):
         if mode:
             self.filterModeChanged.emit(mode)
     
-    def _on_remove_filter(self, filter_rule):
-        self.filterRemoved.emit(filter_rule)
-    
-    def _on_edit_filter(self, filter_rule):
-        self.filterEdited.emit(filter_rule, None)
-
-    def _on_open_rule_tab(self, filter_rule):
-        self.ruleTabRequested.emit(filter_rule)
-    
     def _on_clear_all(self):
         self.allFiltersCleared.emit()
 
@@ -352,7 +394,7 @@ class FilterPanel(QWidget):
                 label = None
         if label is None:
             label = QLabel("No filters yet")
-            label.setStyleSheet(f"color: {AppTheme.TEXT_SECONDARY}; font-style: italic;")
+            label.setObjectName("FilterPanelEmpty")
             label.setAlignment(Qt.AlignCenter)
             self.no_filters_label = label
         return label